@@ -2,11 +2,21 @@ from ninja import NinjaAPI, Schema
 
 from ninja_extra import NinjaExtraAPI
 from ninja_jwt.authentication import JWTAuth
-from ninja_jwt.controller import NinjaJWTDefaultController
 
-api = NinjaExtraAPI()
-api.register_controllers(NinjaJWTDefaultController)
+from accounts.controllers import TokenController
+from accounts.hashing import HASHING_RETRY_AFTER, PasswordHashingBusy
+
+from .renderers import get_renderer
+
+api = NinjaExtraAPI(renderer=get_renderer())
+api.register_controllers(TokenController)
 api.add_router("/campaigns/", "campaigns.api.router")
 api.add_router("/accounts/", "accounts.api.router")
 api.add_router("/payments/", "payments.api.router")
 
+
+@api.exception_handler(PasswordHashingBusy)
+def password_hashing_busy(request, exc):
+    response = api.create_response(request, {"detail": "Too many sign-ins right now, try again shortly"}, status=503)
+    response["Retry-After"] = str(HASHING_RETRY_AFTER)
+    return response
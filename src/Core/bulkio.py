@@ -0,0 +1,130 @@
+# Core/bulkio.py
+"""
+Streaming rows for the import_*/export_* management commands. Files are CSV
+or JSONL, read and written one row at a time and processed in fixed-size
+chunks, so memory stays flat however large the file. "-" means stdin/stdout.
+
+In CSV, list values (e.g. team member emails) are ";"-separated and other
+structured values (e.g. milestones) are JSON; JSONL keeps them native.
+"""
+import csv
+import json
+import sys
+import time
+from contextlib import contextmanager
+from itertools import islice
+
+from django.core.management.base import CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+
+FORMATS = ("csv", "jsonl")
+LIST_SEPARATOR = ";"
+
+
+def detect_format(path: str, fmt: str | None = None) -> str:
+    if fmt:
+        return fmt
+    if path == "-":
+        return "csv"
+    if path.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    if path.endswith(".csv"):
+        return "csv"
+    raise CommandError(f"Can't tell the format of {path!r}; pass --format {'/'.join(FORMATS)}")
+
+
+@contextmanager
+def open_stream(path: str, mode: str):
+    if path == "-":
+        yield sys.stdin if "r" in mode else sys.stdout
+        return
+    with open(path, mode, newline="", encoding="utf-8") as stream:
+        yield stream
+
+
+def read_rows(stream, fmt: str):
+    """Yield (line number, row dict); blank JSONL lines are skipped."""
+    if fmt == "csv":
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line_no, line in enumerate(stream, start=1):
+        if line.strip():
+            try:
+                yield line_no, json.loads(line)
+            except ValueError as e:
+                raise CommandError(f"line {line_no}: invalid JSON ({e})")
+
+
+class RowWriter:
+    def __init__(self, stream, fmt: str, fields):
+        self.stream, self.fmt, self.fields = stream, fmt, list(fields)
+        if fmt == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=self.fields)
+            self._csv.writeheader()
+
+    def write(self, row: dict):
+        if self.fmt == "jsonl":
+            self.stream.write(json.dumps(row, cls=DjangoJSONEncoder) + "\n")
+        else:
+            self._csv.writerow({k: self._csv_value(v) for k, v in row.items()})
+
+    @staticmethod
+    def _csv_value(value):
+        if isinstance(value, list) and all(isinstance(v, str) for v in value):
+            return LIST_SEPARATOR.join(value)
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, cls=DjangoJSONEncoder)
+        return value
+
+
+def chunked(iterable, size: int):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def as_list(value) -> list[str]:
+    """A list cell: native list (JSONL) or ";"-separated string (CSV)."""
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [v.strip() for v in str(value).split(LIST_SEPARATOR) if v.strip()]
+
+
+def as_json(value):
+    """A structured cell: native value (JSONL) or JSON text (CSV); empty is None."""
+    if value in (None, ""):
+        return None
+    return json.loads(value) if isinstance(value, str) else value
+
+
+def as_bool(value, default: bool = True) -> bool:
+    if value in (None, ""):
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "y", "t")
+
+
+class Progress:
+    """Rows done and rows/sec, written to `stream` (stderr, so exports can use stdout)."""
+
+    def __init__(self, stream, verb: str):
+        self.stream, self.verb = stream, verb
+        self.rows = 0
+        self.started = time.perf_counter()
+
+    @property
+    def rate(self) -> float:
+        return self.rows / max(time.perf_counter() - self.started, 1e-9)
+
+    def add(self, rows: int):
+        self.rows += rows
+        self.stream.write(f"{self.verb} {self.rows} rows ({self.rate:,.0f} rows/s)")
+
+    def done(self, what: str):
+        elapsed = time.perf_counter() - self.started
+        self.stream.write(f"{self.verb} {self.rows} {what} in {elapsed:.2f}s ({self.rate:,.0f} rows/s)")
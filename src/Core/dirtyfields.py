@@ -0,0 +1,84 @@
+# Core/dirtyfields.py
+"""
+Change tracking for models whose rows are saved after a few attribute changes
+(User profile updates, Campaign totals).
+
+DirtyFieldsMixin remembers each field's value as loaded from the database or
+last saved. A plain save() of an existing row then writes only the fields that
+differ, plus auto_now timestamps, and skips the UPDATE and the save signals
+entirely when nothing changed. pre_save/post_save receivers see the changed
+fields as `update_fields`. While they run, loaded_value() still returns the
+previous values, e.g. for is_active transitions in campaigns/counters.py.
+
+An explicit save(update_fields=...) or force_insert/force_update save behaves
+as in stock Django.
+"""
+import copy
+
+from django.db.models.expressions import Combinable
+
+
+class DirtyFieldsMixin:
+    def _tracked_fields(self):
+        return [f for f in self._meta.concrete_fields if not f.primary_key]
+
+    def _snapshot(self, fields=None):
+        """Record the current values of `fields` (default: all loaded fields) as clean."""
+        loaded = dict(getattr(self, "_loaded_values", {}))
+        for f in fields if fields is not None else self._tracked_fields():
+            if f.attname in self.__dict__:
+                # JSON fields are mutated in place, so keep a copy to compare against
+                loaded[f.attname] = copy.deepcopy(self.__dict__[f.attname])
+        # always a new dict: copies of this instance (e.g. accounts/auth.py) share the old one
+        self._loaded_values = loaded
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        # only what was reloaded (e.g. a deferred field on first access); other changes stay dirty
+        self._snapshot(None if fields is None else [self._meta.get_field(name) for name in fields])
+
+    def loaded_value(self, field_name, default=None):
+        """The field's value as last loaded or saved (default if it never was)."""
+        attname = self._meta.get_field(field_name).attname
+        return getattr(self, "_loaded_values", {}).get(attname, default)
+
+    def get_dirty_fields(self) -> set[str]:
+        """Names of loaded fields that were changed, and deferred fields that were assigned."""
+        loaded = getattr(self, "_loaded_values", {})
+        dirty = set()
+        for f in self._tracked_fields():
+            if f.attname not in self.__dict__:
+                continue  # deferred and untouched
+            value = self.__dict__[f.attname]
+            if f.attname not in loaded or isinstance(value, Combinable) or value != loaded[f.attname]:
+                dirty.add(f.name)
+        return dirty
+
+    def save(self, *args, **kwargs):
+        partial = (
+            not self._state.adding
+            and hasattr(self, "_loaded_values")
+            and not args
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+            and not kwargs.get("force_update")
+        )
+        if partial:
+            dirty = self.get_dirty_fields()
+            if not dirty:
+                return
+            auto_now = {f.name for f in self._tracked_fields() if getattr(f, "auto_now", False)}
+            kwargs["update_fields"] = dirty | auto_now
+
+        super().save(*args, **kwargs)
+
+        update_fields = kwargs.get("update_fields")
+        self._snapshot(
+            None if update_fields is None else [self._meta.get_field(name) for name in update_fields]
+        )
@@ -0,0 +1,54 @@
+# Core/renderers.py
+"""
+Response renderers for Core.api.api, chosen by settings.API_RENDERER:
+
+- "json":   django-ninja's JSONRenderer (stdlib json + NinjaJSONEncoder)
+- "orjson": ORJSONRenderer below; UUID and dataclasses are handled natively
+            in C, the rest falls back to NinjaJSONEncoder, so both render the
+            same values
+"""
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from ninja.renderers import BaseRenderer, JSONRenderer
+from ninja.responses import NinjaJSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional, see requirements.txt
+    orjson = None
+
+_fallback_encoder = NinjaJSONEncoder()
+
+
+def _default(obj):
+    # Decimals stay strings, as DjangoJSONEncoder renders them
+    if isinstance(obj, Decimal):
+        return str(obj)
+    return _fallback_encoder.default(obj)
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+    # datetimes go through NinjaJSONEncoder, which truncates them to milliseconds
+    # (orjson would keep microseconds); int dict keys become strings like json.dumps
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+    def render(self, request, data, *, response_status):
+        return orjson.dumps(data, default=_default, option=self.options)
+
+
+RENDERERS = {
+    "json": JSONRenderer,
+    "orjson": ORJSONRenderer,
+}
+
+
+def get_renderer(name=None) -> BaseRenderer:
+    name = name or getattr(settings, "API_RENDERER", "json")
+    if name not in RENDERERS:
+        raise ImproperlyConfigured(f"API_RENDERER must be one of {', '.join(RENDERERS)}, not {name!r}")
+    if name == "orjson" and orjson is None:
+        raise ImproperlyConfigured("API_RENDERER = 'orjson' requires the orjson package")
+    return RENDERERS[name]()
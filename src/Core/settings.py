@@ -120,6 +120,19 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+# locmem is per process; to share cached search pages across workers use e.g.
+#   "BACKEND": "django.core.cache.backends.redis.RedisCache",
+#   "LOCATION": "redis://127.0.0.1:6379",
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
@@ -164,8 +177,21 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 NINJA_JWT = {
     'ACCESS_TOKEN_LIFETIME': datetime.timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': datetime.timedelta(hours= 12),
+    # adds username, email and role claims to issued tokens (see accounts/auth.py)
+    'TOKEN_OBTAIN_PAIR_INPUT_SCHEMA': 'accounts.auth.ClaimsTokenObtainPairInputSchema',
 }
 
+# JWT request.user lookups (see accounts/auth.py)
+ACCOUNTS_AUTH_USER_CACHE_TTL = 60  # seconds in the shared cache; evicted early on any user save
+ACCOUNTS_AUTH_LOCAL_CACHE_TTL = 5  # seconds in each process's LRU, i.e. max cross-process staleness
+ACCOUNTS_AUTH_LOCAL_CACHE_SIZE = 1024
+ACCOUNTS_JWT_TRUST_CLAIMS = False  # read-only routes use token claims instead of loading the user
+
+# password hashing for /accounts/register and /token/pair (see accounts/hashing.py)
+ACCOUNTS_HASHING_WORKERS = 2  # threads per process; each hash keeps one core busy
+ACCOUNTS_HASHING_MAX_PENDING = 16  # running + queued hashes before requests get a 503
+ACCOUNTS_HASHING_RETRY_AFTER = 1  # seconds, sent as Retry-After with the 503
+
 AUTH_USER_MODEL = 'accounts.User'
 
 
@@ -177,5 +203,42 @@ CELERY_BEAT_SCHEDULE = {
         "task": "campaigns.tasks.recompute_trending_scores_task",
         "schedule": 120.0,  # seconds
     },
+    "expire-donation-windows-every-5min": {
+        "task": "campaigns.tasks.expire_donation_windows_task",
+        "schedule": 300.0,  # seconds; how late an idle campaign's 24h counters can lag
+    },
+    "recompute-user-scores-every-15min": {
+        "task": "accounts.tasks.recompute_user_scores_task",
+        "schedule": 900.0,  # seconds
+    },
 }
 
+
+# API response renderer: "orjson" or "json" (django-ninja's default); see Core/renderers.py
+API_RENDERER = "orjson"
+
+# campaign search totals (see campaigns/counting.py)
+CAMPAIGN_SEARCH_EXACT_COUNT_LIMIT = 1000  # exact counts up to this many results
+CAMPAIGN_SEARCH_COUNT_CACHE_TTL = 60  # seconds a larger COUNT(*) is reused
+
+# cached search pages (see campaigns/cache.py)
+CAMPAIGN_SEARCH_CACHE_ALIAS = "default"
+CAMPAIGN_SEARCH_CACHE_TTL = 300  # seconds; invalidated early by any campaign write
+CAMPAIGN_SEARCH_TRENDING_MAX_STALENESS = 30  # seconds; trending pages skip write invalidation
+CAMPAIGN_DETAIL_CACHE_TTL = 300  # seconds; invalidated early by campaign/team changes
+CAMPAIGN_SUGGEST_REBUILD_SECONDS = 300  # full rebuild of the in-process typeahead index
+
+# "decay" (trending_score, rescored as it decays) or "hot" (hot_score, rescored
+# only on new activity); see campaigns/pagination.py
+CAMPAIGN_TRENDING_MODE = "decay"
+
+# top-K trending leaderboard, republished by every recompute (see campaigns/leaderboard.py).
+# Snapshots live for CAMPAIGN_SEARCH_TRENDING_MAX_STALENESS. The recompute runs in Celery,
+# so web processes only see its snapshot through a shared CAMPAIGN_SEARCH_CACHE_ALIAS
+# (Redis, see CACHES above); otherwise, and once it expires, a web process builds its
+# own from the database on a miss.
+CAMPAIGN_TRENDING_LEADERBOARD_SIZE = 500
+
+# write-behind engagement counters (see campaigns/engagement.py)
+CAMPAIGN_ENGAGEMENT_FLUSH_SECONDS = 10  # max age of buffered increments
+CAMPAIGN_ENGAGEMENT_MAX_PENDING = 1000  # max buffered events per process
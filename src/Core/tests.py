@@ -0,0 +1,42 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.test import SimpleTestCase
+from ninja.renderers import JSONRenderer
+
+from .renderers import ORJSONRenderer, orjson
+
+UTC = datetime.timezone.utc
+
+
+@skipUnless(orjson, "orjson is not installed")
+class ORJSONRendererTests(SimpleTestCase):
+    def assertSameJSON(self, data):
+        expected = JSONRenderer().render(None, data, response_status=200)
+        actual = ORJSONRenderer().render(None, data, response_status=200)
+        # only the whitespace between tokens may differ
+        self.assertEqual(json.loads(actual), json.loads(expected))
+        self.assertEqual(actual.decode(), json.dumps(json.loads(expected), separators=(",", ":")))
+
+    def test_decimals(self):
+        self.assertSameJSON({"goal": Decimal("1500.00"), "current": Decimal("0.10"), "whole": Decimal("3")})
+
+    def test_datetimes(self):
+        self.assertSameJSON({
+            "utc": datetime.datetime(2026, 1, 2, 3, 4, 5, 123456, tzinfo=UTC),
+            "offset": datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=2))),
+            "naive": datetime.datetime(2026, 1, 2, 3, 4, 5, 999),
+            "date": datetime.date(2026, 1, 2),
+            "time": datetime.time(1, 2, 3, 456789),
+            "duration": datetime.timedelta(hours=1, seconds=5),
+        })
+
+    def test_nested(self):
+        self.assertSameJSON({
+            "items": [{"id": 1, "amounts": [Decimal("1.5"), None, 2.25], "tags": ["a", "b"]}],
+            "ids": {7: uuid.UUID(int=7)},
+            "meta": {"next": None, "ok": True, "created": datetime.datetime(2026, 1, 2, tzinfo=UTC)},
+        })
@@ -1,16 +1,27 @@
 from ninja import Router
 from django.contrib.auth import get_user_model
-from ninja_jwt.authentication import JWTAuth
+from .auth import jwt_auth
+from .hashing import make_password_async
 from typing import List
 from ninja.errors import HttpError
 from .schemas import *
+from .services import associated_campaigns_by_user
 
 router = Router()
 User = get_user_model()
+PROFILE_FIELDS = [f for f in UserSchema.model_fields if f != "id"]
 
-@router.get("/user", response=UserSchema, auth=JWTAuth())
+
+def load_profile(user):
+    """Fetch the profile columns jwt_auth's request.user defers, in one query."""
+    deferred = user.get_deferred_fields() & set(PROFILE_FIELDS)
+    if deferred:
+        user.refresh_from_db(fields=deferred)
+    return user
+
+@router.get("/user", response=UserSchema, auth=jwt_auth)
 def user_detail(request):
-    user = request.user
+    user = load_profile(request.user)
 
     # Safely return all expected fields defined in UserSchema
     return UserSchema(
@@ -27,22 +38,27 @@ def user_detail(request):
     )
 
 # Update profile with JWT
-@router.put("/update", response=AccountSuccessfulResponse, auth=JWTAuth())
+@router.put("/update", response=AccountSuccessfulResponse, auth=jwt_auth)
 def update_profile(request, data: UserSchema):
-    user = request.user
-    for attr, value in data.dict(exclude_unset=True).items():
+    # loaded first so unchanged fields compare equal and aren't written
+    user = load_profile(request.user)
+    for attr, value in data.dict(exclude_unset=True, exclude={"id"}).items():
         setattr(user, attr, value)
+    # only the fields that actually changed are written; no-op if none did
     user.save()
     return {"message": "User updated successfully"}
 
 # Keep registration (open/public)
 @router.post("/register")
-def register(request, payload: registerUser):
+async def register(request, payload: registerUser):
+    # hashed in the bounded pool, off the event loop; a full pool is a 503 (Core/api.py)
+    password = await make_password_async(payload.password)
     try:
-        User.objects.create_user(
-            username=payload.username,
-            email=payload.email,
-            password=payload.password,
+        # what create_user does, minus hashing inline
+        await User.objects.acreate(
+            username=User.normalize_username(payload.username),
+            email=User.objects.normalize_email(payload.email),
+            password=password,
             first_name=payload.first_name,
             last_name=payload.last_name,
             phone_number=payload.phone_number,
@@ -55,11 +71,13 @@ def register(request, payload: registerUser):
 
 @router.get("/spotlight_users", response=List[UserOut])
 def get_spotlight_users(request):
-    users = (
+    users = list(
         User.objects
         .filter(is_active=True)
         .order_by("-user_score")[:4]
     )
+    # all users' projects in two queries rather than u.associated_campaigns per user
+    projects = associated_campaigns_by_user(u.id for u in users)
 
     return [
         {
@@ -68,8 +86,7 @@ def get_spotlight_users(request):
             "name": f"{u.first_name} {u.last_name[0] + '.' if u.last_name else ''}",
             "profile_picture": "https://images.unsplash.com/photo-1534796636912-3b95b3ab5986?q=80&w=1600&auto=format&fit=crop",
             "blurb": u.blurb,
-            # Your property already returns values("id","title") → list of dicts
-            "associated_projects": list(u.associated_campaigns),
+            "associated_projects": projects[u.id],
         }
         for u in users
     ]
\ No newline at end of file
@@ -0,0 +1,153 @@
+# accounts/auth.py
+"""
+JWT authentication that resolves request.user without a database hit per call.
+
+Users are looked up through a small per-process LRU (ACCOUNTS_AUTH_LOCAL_CACHE_TTL,
+a few seconds) in front of the shared Django cache (ACCOUNTS_AUTH_USER_CACHE_TTL),
+and only then the database. Both hold just CACHED_FIELDS, never the password
+hash or profile columns; request.user is built from them with the remaining
+fields deferred, so views that need more load it themselves (accounts/api.py).
+accounts/signals.py evicts a user from both on every save or delete, which
+covers profile updates, deactivation and password changes; other processes'
+LRUs catch up within the local TTL.
+
+Access tokens also carry a few non-sensitive claims (CLAIM_FIELDS). An
+authenticator created with trust_claims=True builds request.user from those
+claims alone, for read-only routes that only need to know who is calling.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils.translation import gettext_lazy as _
+from ninja_jwt.authentication import JWTAuth
+from ninja_jwt.exceptions import AuthenticationFailed, InvalidToken
+from ninja_jwt.models import TokenUser
+from ninja_jwt.schema import TokenObtainPairInputSchema
+from ninja_jwt.settings import api_settings
+from ninja_jwt.tokens import RefreshToken
+
+USER_CACHE_TTL = getattr(settings, "ACCOUNTS_AUTH_USER_CACHE_TTL", 60)
+LOCAL_CACHE_TTL = getattr(settings, "ACCOUNTS_AUTH_LOCAL_CACHE_TTL", 5)
+LOCAL_CACHE_SIZE = getattr(settings, "ACCOUNTS_AUTH_LOCAL_CACHE_SIZE", 1024)
+TRUST_CLAIMS = getattr(settings, "ACCOUNTS_JWT_TRUST_CLAIMS", False)
+
+# copied into access tokens at login; never anything secret or needed for writes
+CLAIM_FIELDS = ("username", "email", "role")
+# what the auth caches keep per user
+CACHED_FIELDS = ("id", "is_active", *CLAIM_FIELDS)
+
+
+def user_cache_key(user_id) -> str:
+    return f"accounts:auth:user:{user_id}"
+
+
+class _LocalUserCache:
+    """Thread-safe LRU of user id -> (expires at, cached fields) with a short TTL."""
+
+    def __init__(self, size, ttl):
+        self.size, self.ttl = size, ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, user_id):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return entry[1]
+
+    def set(self, user_id, values):
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, values)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def discard(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+local_users = _LocalUserCache(LOCAL_CACHE_SIZE, LOCAL_CACHE_TTL)
+
+
+def forget_user(user_id):
+    """Drop a user from both cache layers (see accounts/signals.py)."""
+    local_users.discard(user_id)
+    cache.delete(user_cache_key(user_id))
+
+
+class ClaimsUser(TokenUser):
+    """Read-only request.user backed by the token's claims; it has no save()."""
+
+    @property
+    def email(self) -> str:
+        return self.token.get("email", "")
+
+    @property
+    def role(self) -> str:
+        return self.token.get("role", "")
+
+
+class CachedJWTAuth(JWTAuth):
+    def __init__(self, trust_claims: bool = False):
+        super().__init__()
+        self.trust_claims = trust_claims
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        if self.trust_claims and all(field in validated_token for field in CLAIM_FIELDS):
+            return ClaimsUser(validated_token)
+
+        values = local_users.get(user_id)
+        if values is None:
+            values = cache.get(user_cache_key(user_id))
+            if values is None:
+                values = (
+                    self.user_model.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+                    .values(*CACHED_FIELDS)
+                    .first()
+                )
+                if values is None:
+                    raise AuthenticationFailed(_("User not found"))
+                cache.set(user_cache_key(user_id), values, USER_CACHE_TTL)
+            local_users.set(user_id, values)
+
+        if not values["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"))
+        # a fresh instance per request, as if loaded with .only(*CACHED_FIELDS)
+        fields = [f.attname for f in self.user_model._meta.concrete_fields if f.attname in values]
+        return self.user_model.from_db(DEFAULT_DB_ALIAS, fields, [values[f] for f in fields])
+
+
+def add_user_claims(token, user):
+    for field in CLAIM_FIELDS:
+        token[field] = getattr(user, field, "") or ""
+    return token
+
+
+class ClaimsTokenObtainPairInputSchema(TokenObtainPairInputSchema):
+    """Token pair whose claims (and so every refreshed access token's) include CLAIM_FIELDS."""
+
+    @classmethod
+    def get_token(cls, user):
+        refresh = add_user_claims(RefreshToken.for_user(user), user)
+        return {"refresh": str(refresh), "access": str(refresh.access_token)}
+
+
+# for routes that load or modify request.user
+jwt_auth = CachedJWTAuth()
+# for read-only routes that only need an authenticated caller
+jwt_claims_auth = CachedJWTAuth(trust_claims=TRUST_CLAIMS)
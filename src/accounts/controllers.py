@@ -0,0 +1,40 @@
+# accounts/controllers.py
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import update_last_login
+from ninja_extra import ControllerBase, api_controller, http_post
+from ninja_extra.permissions import AllowAny
+from ninja_jwt.controller import AsyncTokenObtainPairController, AsyncTokenVerificationController
+from ninja_jwt.exceptions import AuthenticationFailed
+from ninja_jwt.schema_control import SchemaControl
+from ninja_jwt.settings import api_settings
+
+from .hashing import authenticate_async
+from .schemas import loginSchema
+
+schema = SchemaControl(api_settings)
+
+
+@api_controller("/token", permissions=[AllowAny], tags=["token"], auth=None)
+class TokenController(ControllerBase, AsyncTokenVerificationController, AsyncTokenObtainPairController):
+    """
+    ninja_jwt's async default controller, except that /pair checks the password
+    in the hashing pool (accounts/hashing.py). ninja_jwt authenticates while
+    validating the request body, which would hash on the event loop.
+    """
+
+    auto_import = False
+
+    @http_post(
+        "/pair",
+        response=schema.obtain_pair_schema.get_response_schema(),
+        url_name="token_obtain_pair",
+        operation_id="token_obtain_pair",
+    )
+    async def obtain_token(self, credentials: loginSchema):
+        user = await authenticate_async(credentials.email, credentials.password)
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed("No active account found with the given credentials")
+        tokens = schema.obtain_pair_schema.get_token(user)
+        if api_settings.UPDATE_LAST_LOGIN:
+            await sync_to_async(update_last_login)(None, user)
+        return {"email": user.email, **tokens}
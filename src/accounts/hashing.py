@@ -0,0 +1,67 @@
+# accounts/hashing.py
+"""
+Password hashing off the event loop, for async views.
+
+One PBKDF2 hash is ~100ms of CPU. Running it inline in an async view stalls
+every other request on the worker, and asgiref's sync_to_async would queue it
+behind the ORM's shared thread. Instead it runs in a small dedicated pool
+(ACCOUNTS_HASHING_WORKERS). At most ACCOUNTS_HASHING_MAX_PENDING hashes may
+be running or queued; past that, callers get PasswordHashingBusy, which
+Core/api.py turns into a 503 with Retry-After. This keeps a signup or login
+spike from building an unbounded queue.
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password, verify_password
+
+HASHING_WORKERS = getattr(settings, "ACCOUNTS_HASHING_WORKERS", 2)
+HASHING_MAX_PENDING = getattr(settings, "ACCOUNTS_HASHING_MAX_PENDING", 16)
+HASHING_RETRY_AFTER = getattr(settings, "ACCOUNTS_HASHING_RETRY_AFTER", 1)
+
+_executor = ThreadPoolExecutor(max_workers=HASHING_WORKERS, thread_name_prefix="password-hashing")
+_slots = threading.BoundedSemaphore(HASHING_MAX_PENDING)
+
+
+class PasswordHashingBusy(Exception):
+    """Every hashing slot is taken; the client should retry later."""
+
+
+async def run_hashing(fn, *args):
+    """Run fn(*args) in the hashing pool, or raise PasswordHashingBusy if it is full."""
+    slots = _slots
+    if not slots.acquire(blocking=False):
+        raise PasswordHashingBusy
+    future = _executor.submit(fn, *args)
+    # the slot is held until the hash finishes, even if the request is cancelled first
+    future.add_done_callback(lambda _: slots.release())
+    return await asyncio.wrap_future(future)
+
+
+async def make_password_async(raw_password) -> str:
+    return await run_hashing(make_password, raw_password)
+
+
+async def authenticate_async(username, password):
+    """
+    ModelBackend.authenticate with the hashing in the pool. Only the model
+    backend is configured (no AUTHENTICATION_BACKENDS), so this is equivalent.
+    """
+    User = get_user_model()
+    try:
+        user = await User._default_manager.aget_by_natural_key(username)
+    except User.DoesNotExist:
+        # hash anyway so unknown accounts take as long as wrong passwords (Django #20760)
+        await make_password_async(password)
+        return None
+
+    is_correct, must_update = await run_hashing(verify_password, password, user.password)
+    if not (is_correct and user.is_active):
+        return None
+    if must_update:
+        user.password = await make_password_async(password)
+        await user.asave(update_fields=["password"])
+    return user
@@ -0,0 +1,73 @@
+# accounts/management/commands/bench_signups.py
+import asyncio
+import statistics
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+
+from accounts.hashing import HASHING_MAX_PENDING, HASHING_WORKERS, PasswordHashingBusy, make_password_async
+
+
+async def inline_hash(raw):
+    """The old behaviour: the hash runs on the event loop itself."""
+    return make_password(raw)
+
+
+async def run(hash_password, clients, seconds, probe_interval, backoff):
+    """
+    `clients` coroutines sign up in a loop for `seconds` while a probe stands in
+    for the worker's other traffic: it wakes every `probe_interval` and records
+    how late it was, i.e. the extra latency any other request would have seen.
+    """
+    deadline = time.perf_counter() + seconds
+    counts = {"signups": 0, "rejected": 0}
+    delays = []
+
+    async def client(n):
+        i = 0
+        while time.perf_counter() < deadline:
+            try:
+                await hash_password(f"bench-password-{n}-{i}")
+                counts["signups"] += 1
+            except PasswordHashingBusy:
+                counts["rejected"] += 1
+                await asyncio.sleep(backoff)
+            i += 1
+
+    async def probe():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await asyncio.sleep(probe_interval)
+            delays.append((time.perf_counter() - start - probe_interval) * 1000)
+
+    await asyncio.gather(probe(), *(client(n) for n in range(clients)))
+    return counts, delays
+
+
+class Command(BaseCommand):
+    help = (
+        "Signups/sec and the latency other requests on the same event loop see, "
+        "hashing inline vs in the bounded pool (accounts/hashing.py). "
+        "Only the hashing is measured; nothing is written to the database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--clients", type=int, nargs="+", default=[4, 32])
+        parser.add_argument("--seconds", type=float, default=5.0)
+        parser.add_argument("--probe-interval", type=float, default=0.01, help="seconds")
+        parser.add_argument("--backoff", type=float, default=0.05, help="seconds a rejected client waits")
+
+    def handle(self, *args, clients, seconds, probe_interval, backoff, **options):
+        self.stdout.write(f"pool: {HASHING_WORKERS} workers, {HASHING_MAX_PENDING} pending max")
+        for n in clients:
+            for label, hash_password in (("inline", inline_hash), ("pool", make_password_async)):
+                counts, delays = asyncio.run(run(hash_password, n, seconds, probe_interval, backoff))
+                delays.sort()
+                p50 = statistics.median(delays)
+                p99 = delays[int(len(delays) * 0.99) - 1] if len(delays) > 1 else delays[0]
+                self.stdout.write(
+                    f"{n:>4} clients  {label:<6}  {counts['signups'] / seconds:7.1f} signups/s"
+                    f"  rejected {counts['rejected']:>5}"
+                    f"  probe delay p50 {p50:7.1f}ms  p99 {p99:7.1f}ms"
+                )
@@ -0,0 +1,33 @@
+# accounts/management/commands/export_users.py
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from Core.bulkio import FORMATS, Progress, RowWriter, chunked, detect_format, open_stream
+
+from .import_users import FIELDS
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream all users to CSV or JSONL, in the columns import_users reads. "
+        "Password hashes are left out unless --include-password-hashes is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", default="-", help='output file, or "-" (default) for stdout')
+        parser.add_argument("--format", choices=FORMATS)
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument("--include-password-hashes", action="store_true")
+
+    def handle(self, *args, path, format, chunk_size, include_password_hashes, **options):
+        fields = FIELDS if include_password_hashes else [f for f in FIELDS if f != "password"]
+        progress = Progress(self.stderr, "exported")
+        rows = get_user_model().objects.order_by("id").values_list(*fields).iterator(chunk_size=chunk_size)
+
+        with open_stream(path, "w") as stream:
+            writer = RowWriter(stream, detect_format(path, format), fields)
+            for chunk in chunked(rows, chunk_size):
+                for values in chunk:
+                    writer.write(dict(zip(fields, values)))
+                progress.add(len(chunk))
+        progress.done("users")
@@ -0,0 +1,89 @@
+# accounts/management/commands/import_users.py
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, transaction
+
+from campaigns.counters import rebuild_platform_counters
+from Core.bulkio import FORMATS, Progress, as_bool, chunked, detect_format, open_stream, read_rows
+
+# password is optional; see the command help
+FIELDS = [
+    "username", "email", "first_name", "last_name", "phone_number", "role",
+    "school", "blurb", "bio", "wallet_address", "links", "is_active", "password",
+]
+REQUIRED = ("username", "email")
+
+
+def build_user(User, line_no, row):
+    for field in REQUIRED:
+        if not row.get(field):
+            raise CommandError(f"line {line_no}: {field} is required")
+    if None in row:
+        # csv.DictReader puts cells beyond the header under the key None
+        raise CommandError(f"line {line_no}: too many columns")
+    unknown = set(row) - set(FIELDS)
+    if unknown:
+        raise CommandError(f"line {line_no}: unknown columns {', '.join(sorted(unknown))}")
+
+    password = row.get("password") or None
+    if password is None:
+        # deferred: no usable password until the user resets it
+        password = make_password(None)
+    else:
+        try:
+            identify_hasher(password)
+        except ValueError:
+            raise CommandError(f"line {line_no}: password must be an encoded hash, not a raw password")
+
+    values = {f: row[f] or None for f in ("phone_number", "school", "blurb", "bio", "wallet_address", "links") if f in row}
+    return User(
+        username=User.normalize_username(row["username"]),
+        email=User.objects.normalize_email(row["email"]),
+        first_name=row.get("first_name") or "",
+        last_name=row.get("last_name") or "",
+        role=row.get("role") or User._meta.get_field("role").default,
+        is_active=as_bool(row.get("is_active")),
+        password=password,
+        **values,
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-create users from CSV or JSONL (columns: " + ", ".join(FIELDS) + "). "
+        "`password` must already be hashed (e.g. from export_users --include-password-hashes); "
+        "rows without one get an unusable password, to be set via password reset. "
+        "Each chunk is one transaction."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help='input file, or "-" for stdin')
+        parser.add_argument("--format", choices=FORMATS)
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--skip-existing", action="store_true",
+            help="Ignore rows whose email or username already exists instead of failing",
+        )
+
+    def handle(self, *args, path, format, chunk_size, skip_existing, **options):
+        User = get_user_model()
+        fmt = detect_format(path, format)
+        progress = Progress(self.stderr, "imported")
+
+        with open_stream(path, "r") as stream:
+            for chunk in chunked(read_rows(stream, fmt), chunk_size):
+                users = [build_user(User, line_no, row) for line_no, row in chunk]
+                try:
+                    with transaction.atomic():
+                        User.objects.bulk_create(users, ignore_conflicts=skip_existing)
+                except IntegrityError as e:
+                    raise CommandError(
+                        f"lines {chunk[0][0]}-{chunk[-1][0]}: {e} "
+                        f"({progress.rows} rows were imported before this chunk; use --skip-existing to ignore duplicates)"
+                    )
+                progress.add(len(users))
+
+        # bulk_create skips the post_save signals that keep these current
+        rebuild_platform_counters()
+        progress.done("users")
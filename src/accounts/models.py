@@ -3,12 +3,14 @@ from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.db.models import Q
 
+from Core.dirtyfields import DirtyFieldsMixin
+
 
 class Role(models.TextChoices):
     CREATOR = "creator", "Creator"
     EXPLORER = "explorer", "Explorer"
 
-class User(AbstractUser):
+class User(DirtyFieldsMixin, AbstractUser):
     
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username', 'first_name', 'last_name', 'phone_number' ]
@@ -28,8 +30,13 @@ class User(AbstractUser):
     is_email_verified = models.BooleanField(default=False)
     school = models.CharField(max_length=255, blank=True, null=True)
     blurb = models.CharField(max_length=160, blank=True, null=True)
-    user_score = models.IntegerField(default=0)
+    user_score = models.IntegerField(default=0)  # maintained by accounts.services.recompute_user_scores
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # get_spotlight_users: active users by score
+            models.Index(fields=["is_active", "-user_score"], name="user_active_score_idx"),
+        ]
 
     @property
     def associated_campaigns(self):
@@ -0,0 +1,98 @@
+# accounts/services.py
+import logging
+import time
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Sum
+
+from campaigns.models import Campaign
+
+logger = logging.getLogger(__name__)
+
+# signal -> points per unit in User.user_score
+USER_SCORE_WEIGHTS = {
+    "funds_raised": 0.1,  # per currency unit raised by campaigns the user created
+    "campaigns_created": 25,
+    "team_memberships": 15,
+    "likes": 1,  # engagement on the user's own campaigns
+    "comments": 2,
+    "recruiter_saves": 5,
+}
+
+
+def associated_campaigns_by_user(user_ids) -> dict[int, list[dict]]:
+    """
+    user id -> [{"id", "title"}, ...] of the campaigns each user created or is
+    on the team of, ordered by id. The same data as User.associated_campaigns
+    for many users at once: two plain index lookups instead of an OR join per user.
+    """
+    user_ids = list(user_ids)
+    projects = {user_id: {} for user_id in user_ids}
+
+    created = Campaign.objects.filter(creator_id__in=user_ids).values_list("creator_id", "id", "title")
+    teams = (
+        Campaign.team_members.through.objects.filter(user_id__in=user_ids)
+        .values_list("user_id", "campaign_id", "campaign__title")
+    )
+    for rows in (created, teams):
+        for user_id, campaign_id, title in rows:
+            projects[user_id][campaign_id] = {"id": campaign_id, "title": title}
+
+    return {
+        user_id: [by_id[campaign_id] for campaign_id in sorted(by_id)]
+        for user_id, by_id in projects.items()
+    }
+
+
+def _user_score_signals() -> dict[int, dict]:
+    """user id -> {signal: value}, from two grouped aggregate queries."""
+    signals = {}
+    created = Campaign.objects.values("creator_id").annotate(
+        funds_raised=Sum("current_amount"),
+        campaigns_created=Count("id"),
+        likes=Sum("like_count"),
+        comments=Sum("comment_count"),
+        recruiter_saves=Sum("recruiter_saves"),
+    )
+    for row in created.order_by():
+        signals[row.pop("creator_id")] = row
+    teams = (
+        Campaign.team_members.through.objects.values("user_id")
+        .annotate(team_memberships=Count("id"))
+        .order_by()
+    )
+    for row in teams:
+        signals.setdefault(row["user_id"], {})["team_memberships"] = row["team_memberships"]
+    return signals
+
+
+def user_score(signals: dict) -> int:
+    return int(sum(weight * float(signals.get(name) or 0) for name, weight in USER_SCORE_WEIGHTS.items()))
+
+
+def recompute_user_scores(chunk_size: int = 1000) -> int:
+    """
+    Recompute every user's score from campaign funding, team membership and
+    engagement, and bulk_update only the rows whose score changed, chunk_size
+    at a time. Returns the number of rows rewritten.
+    """
+    started = time.perf_counter()
+    signals = _user_score_signals()
+    User = get_user_model()
+
+    changed, rewritten = [], 0
+    for user in User.objects.only("id", "user_score").order_by("id").iterator(chunk_size=chunk_size):
+        score = user_score(signals.get(user.id, {}))
+        if score != user.user_score:
+            user.user_score = score
+            changed.append(user)
+        if len(changed) >= chunk_size:
+            User.objects.bulk_update(changed, ["user_score"])
+            rewritten += len(changed)
+            changed = []
+    if changed:
+        User.objects.bulk_update(changed, ["user_score"])
+        rewritten += len(changed)
+
+    logger.info("user score recompute rewrote %d rows in %.3fs", rewritten, time.perf_counter() - started)
+    return rewritten
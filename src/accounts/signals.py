@@ -0,0 +1,16 @@
+# accounts/signals.py
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .auth import forget_user
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def user_changed(sender, instance, **kwargs):
+    # profile updates, deactivation and set_password() all end in a save; evict
+    # after commit so a concurrent request can't re-cache the old row
+    user_id = instance.pk
+    transaction.on_commit(lambda: forget_user(user_id))
@@ -0,0 +1,7 @@
+# accounts/tasks.py
+from celery import shared_task
+from .services import recompute_user_scores
+
+@shared_task
+def recompute_user_scores_task():
+    return recompute_user_scores()
@@ -1,3 +1,198 @@
+import threading
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from ninja_jwt.tokens import RefreshToken
+
+from campaigns.models import Campaign
+
+from . import hashing
+from .auth import CACHED_FIELDS, local_users, user_cache_key
+from .services import recompute_user_scores
+
+
+class SpotlightUsersTests(TestCase):
+    def make_user(self, name, score):
+        return get_user_model().objects.create_user(
+            username=name, email=f"{name}@example.com", password="pw",
+            first_name=name.title(), last_name="Doe", user_score=score,
+        )
+
+    def add_campaigns(self, user, count, team=()):
+        for i in range(count):
+            campaign = Campaign.objects.create(
+                title=f"{user.username} {i}", description="d", goal_amount=100, creator=user
+            )
+            campaign.team_members.add(*team)
+
+    def spotlight(self):
+        # users + created campaigns + team memberships, however many users/campaigns
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/accounts/spotlight_users")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_query_count_is_constant(self):
+        first = self.make_user("first", 10)
+        self.add_campaigns(first, 1)
+        self.assertEqual(len(self.spotlight()), 1)
+
+        others = [self.make_user(f"user{i}", i) for i in range(5)]
+        for user in others:
+            self.add_campaigns(user, 3, team=[first])
+        self.assertEqual(len(self.spotlight()), 4)
+
+    def test_projects_match_associated_campaigns(self):
+        alice, bob = self.make_user("alice", 2), self.make_user("bob", 1)
+        self.add_campaigns(alice, 2, team=[bob])
+        self.add_campaigns(bob, 1, team=[alice, bob])
+
+        projects = {u["id"]: u["associated_projects"] for u in self.spotlight()}
+        for user in (alice, bob):
+            expected = sorted(user.associated_campaigns, key=lambda p: p["id"])
+            self.assertEqual(projects[user.id], expected)
+
+
+class CachedJWTAuthTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="al", email="al@example.com", password="pw")
+        response = self.client.post(
+            "/api/token/pair", {"email": "al@example.com", "password": "pw"}, content_type="application/json"
+        )
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {response.json()['access']}"}
+
+    def tearDown(self):
+        local_users.discard(self.user.pk)
+
+    def me(self):
+        return self.client.get("/api/accounts/user", **self.auth)
+
+    def test_user_is_cached(self):
+        self.assertEqual(self.me().status_code, 200)
+        # only the view's profile query; the auth lookup is cached
+        with self.assertNumQueries(1):
+            self.assertEqual(self.me().json()["username"], "al")
+        # another process: only the shared cache is warm
+        local_users.discard(self.user.pk)
+        with self.assertNumQueries(1):
+            self.me()
+
+    def test_cache_holds_no_secrets(self):
+        self.me()
+        self.assertEqual(set(cache.get(user_cache_key(self.user.pk))), set(CACHED_FIELDS))
+
+    def test_profile_update_and_deactivation_invalidate(self):
+        self.me()
+        profile = {**self.me().json(), "first_name": "Al"}
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.put("/api/accounts/update", profile, content_type="application/json", **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.me().json()["first_name"], "Al")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.is_active = False
+            self.user.save()
+        self.assertEqual(self.me().status_code, 401)
+
+
+class RegisterTests(TestCase):
+    payload = {
+        "username": "al", "email": "al@example.com", "password": "s3cret-pw",
+        "first_name": "Al", "last_name": "Doe", "phone_number": "555",
+    }
+
+    def post(self, path, data):
+        return self.client.post(path, data, content_type="application/json")
+
+    def test_register_then_obtain_token(self):
+        self.assertEqual(self.post("/api/accounts/register", self.payload).status_code, 200)
+        self.assertTrue(get_user_model().objects.get(username="al").check_password("s3cret-pw"))
+
+        response = self.post("/api/token/pair", {"email": "al@example.com", "password": "s3cret-pw"})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("access", response.json())
+        response = self.post("/api/token/pair", {"email": "al@example.com", "password": "wrong"})
+        self.assertEqual(response.status_code, 401)
+
+    def test_saturated_pool_returns_503(self):
+        full = threading.BoundedSemaphore(1)
+        full.acquire()
+        with mock.patch.object(hashing, "_slots", full):
+            response = self.post("/api/accounts/register", self.payload)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], str(hashing.HASHING_RETRY_AFTER))
+        self.assertFalse(get_user_model().objects.exists())
+
+
+class ProfileUpdateTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(
+            username="al", email="al@example.com", password="pw", first_name="Al", last_name="Doe"
+        )
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(self.user).access_token}"}
+        self.profile = {
+            "id": self.user.pk, "username": "al", "email": "al@example.com",
+            "first_name": "Al", "last_name": "Doe", "role": self.user.role,
+        }
+
+    def tearDown(self):
+        local_users.discard(self.user.pk)
+
+    def update(self, **changes):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(
+                "/api/accounts/update", {**self.profile, **changes}, content_type="application/json", **self.auth
+            )
+        self.assertEqual(response.status_code, 200)
+        return [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+
+    def test_only_changed_fields_are_written(self):
+        (update,) = self.update(bio="Builds robots")
+        self.assertIn('"bio"', update)
+        self.assertNotIn('"password"', update)
+        self.assertNotIn('"last_login"', update)
+        self.assertEqual(get_user_model().objects.get(pk=self.user.pk).bio, "Builds robots")
+
+    def test_unchanged_profile_is_not_written(self):
+        self.assertEqual(self.update(), [])
+
+
+class UserScoreTests(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        self.ann, self.bob, self.cy = (
+            User.objects.create_user(username=n, email=f"{n}@example.com", password="pw") for n in ("ann", "bob", "cy")
+        )
+        campaign = Campaign.objects.create(title="A", description="d", goal_amount=100, creator=self.ann)
+        campaign.team_members.add(self.bob)
+
+    def scores(self):
+        return dict(get_user_model().objects.values_list("username", "user_score"))
+
+    def updates(self, **kwargs):
+        with CaptureQueriesContext(connection) as queries:
+            rewritten = recompute_user_scores(**kwargs)
+        return rewritten, [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+
+    def test_only_changed_rows_are_written(self):
+        rewritten, updates = self.updates()
+        self.assertEqual(rewritten, 2)  # cy has nothing to score
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(self.scores(), {"ann": 25, "bob": 15, "cy": 0})
+
+        self.assertEqual(self.updates(), (0, []))
+
+        Campaign.objects.update(like_count=4)
+        rewritten, updates = self.updates()
+        self.assertEqual(rewritten, 1)
+        self.assertEqual(self.scores()["ann"], 29)
 
-# Create your tests here.
+    def test_chunked_writes(self):
+        rewritten, updates = self.updates(chunk_size=1)
+        self.assertEqual((rewritten, len(updates)), (2, 2))
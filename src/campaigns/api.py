@@ -1,24 +1,43 @@
+import json
+from itertools import islice
 from typing import List, Optional
-from ninja import Router
-from ninja_jwt.authentication import JWTAuth
-from django.shortcuts import get_object_or_404
+from ninja import Query, Router
+from ninja.errors import HttpError
+from ninja.responses import NinjaJSONEncoder
 from django.contrib.auth import get_user_model
-from django.db.models import Sum, Q
-from django.core.paginator import Paginator
-from django.utils.timezone import now
+from django.contrib.auth.models import AnonymousUser
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 
+from accounts.auth import jwt_auth, jwt_claims_auth
 
 from .models import *
 from .schemas import *
+from .cache import (
+    get_cached_detail,
+    get_cached_details,
+    get_cached_page,
+    search_page_key,
+    set_cached_detail,
+    set_cached_details,
+    set_cached_page,
+)
+from .counters import get_platform_counters
+from .counting import count_results
+from .engagement import ANONYMOUS_EVENTS, ENGAGEMENT_EVENTS, engagement_buffer
+from .facets import compute_facets, parse_facets
+from .leaderboard import get_trending_leaderboard, leaderboard_position, leaderboard_slice
+from .pagination import KEYSET_SORTS, decode_cursor, encode_cursor, keyset_ordering, keyset_page
+from .readmodel import card_json, detail_entries, get_cards
+from .search import get_search_backend, normalize_filters
+from .services import filter_by_tags, split_tags, tag_prefetch
+from .suggest import suggest_index
 
 router = Router()
 
-def _csv_to_list(value: str | None) -> list[str]:
-    if not value:
-        return []
-    # split by comma, strip spaces, drop empties
-    return [t.strip() for t in value.split(",") if t.strip()]
-
+MAX_DETAIL_BATCH = 100
+MAX_PAGE_SIZE = 100
 
 
 # @router.get("/mine", response=List[CampaignOut], auth=JWTAuth())
@@ -48,7 +67,7 @@ def _csv_to_list(value: str | None) -> list[str]:
 #     # Return queryset normally (we can fallback to manual list later)
 #     return campaigns
 
-@router.post("/create", response=CampaignOut, auth=JWTAuth())
+@router.post("/create", response=CampaignOut, auth=jwt_auth)
 def create_campaign(request, payload: CampaignEntryCreateSchema):
     # Use payload data to create a new campaign
     campaign = Campaign.objects.create(
@@ -79,75 +98,156 @@ def create_campaign(request, payload: CampaignEntryCreateSchema):
 User = get_user_model()
 
 
-# Detailed campaign info for frontend (with JWTAuth)
-@router.get("/detail/{campaign_id}/", auth=JWTAuth())
+# Many campaigns' details in one request, e.g. for card grids
+@router.get("/detail/batch", auth=jwt_claims_auth)
+def campaign_detail_batch(request, ids: str):
+    """
+    `ids` is comma-separated (up to MAX_DETAIL_BATCH). Items come back in the
+    requested order; unknown ids are skipped. Uncached campaigns are read from
+    the read model together, so the query count doesn't grow with the batch.
+    """
+    try:
+        campaign_ids = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+    except ValueError:
+        raise HttpError(400, "ids must be comma-separated integers")
+    if len(campaign_ids) > MAX_DETAIL_BATCH:
+        raise HttpError(400, f"At most {MAX_DETAIL_BATCH} ids per batch")
+
+    entries = get_cached_details(campaign_ids)
+    missing = [i for i in campaign_ids if i not in entries]
+    if missing:
+        loaded = detail_entries(missing)
+        set_cached_details(loaded)
+        entries.update(loaded)
+
+    # the cached bodies are already JSON, so they are spliced in as-is
+    body = b'{"items":[' + b",".join(entries[i]["body"] for i in campaign_ids if i in entries) + b"]}"
+    return HttpResponse(body, content_type="application/json")
+
+
+# Detailed campaign info for frontend (JWT; request.user may come from token claims)
+@router.get("/detail/{campaign_id}/", auth=jwt_claims_auth)
 def campaign_detail(request, campaign_id: int):
-    c = get_object_or_404(Campaign, id=campaign_id)
-    return {
-        "id": c.id,
-        "title": c.title,
-        "school": c.school,
-        "description": c.description,
-        "goal_amount": float(c.goal_amount),
-        "current_amount": float(c.current_amount),
-        "tags": [t.strip() for t in (c.tags or "").split(",") if t.strip()],
-        "images": [
-            "https://images.unsplash.com/photo-1534796636912-3b95b3ab5986?q=80&w=1600&auto=format&fit=crop",
-            "https://images.unsplash.com/photo-1542831371-29b0f74f9713?q=80&w=1600&auto=format&fit=crop",
-            "https://images.unsplash.com/photo-1542831371-d531d36971e6?q=80&w=1600&auto=format&fit=crop",
-        ],
-        "creator": {
-            "id": c.creator.id,
-            "name": getattr(c.creator, "username", str(c.creator)),
-        },
-        "team_members": [
-            {"id": u.id, "name": getattr(u, "username", str(u))}
-            for u in c.team_members.all()
-        ],
-        "is_sponsored": bool(c.sponsored_by),
-        "sponsored_by": c.sponsored_by,
-        "start_date": str(c.start_date),
-        "end_date": str(c.end_date) if c.end_date else None,
-        "milestones": c.milestones if c.milestones is not None else [],
-        "verified": True,
-    }
+    """
+    Body precomputed in the read model (campaigns/readmodel.py) and cached
+    per campaign (campaigns/cache.py). The ETag is a hash of the body and
+    Last-Modified moves whenever the body does, so If-None-Match / If-Modified-Since
+    re-polls of an unchanged campaign get a 304 without touching the database.
+    """
+    entry = get_cached_detail(campaign_id)
+    if entry is None:
+        entry = detail_entries([campaign_id]).get(campaign_id)
+        if entry is None:
+            raise Http404("No Campaign matches the given query.")
+        set_cached_detail(campaign_id, entry)
+
+    response = HttpResponse(entry["body"], content_type="application/json")
+    response["ETag"] = entry["etag"]
+    response["Last-Modified"] = http_date(entry["last_modified"])
+    response["Cache-Control"] = "private, no-cache"
+    return get_conditional_response(
+        request, etag=entry["etag"], last_modified=entry["last_modified"], response=response
+    )
+
 
 #stats for homepage
 @router.get("/stats", response=StatsOut, auth=None)
 def get_stats(request):
-
-    active_campaigns_count = Campaign.objects.filter(is_active=True).count()
-    active_creators_count = User.objects.filter(is_active=True).distinct().count()
+    # one-row read; the totals are maintained as campaigns, users and transactions change
+    counters = get_platform_counters()
 
     return {
-        "active_projects": active_campaigns_count,
-        "funds_raised": 200,
-        "active_creators": active_creators_count,
+        "active_projects": counters.active_projects,
+        "funds_raised": int(counters.funds_raised),
+        "active_creators": counters.active_creators,
     }
 
 
 # Public route for spotlight campaigns
 @router.get("/spotlight")
 def spotlight(request):
-    items = Campaign.objects.filter(is_active=True).order_by("-trending_score")[:3]
-    return {
-        "items": [
+    items = _leaderboard_spotlight(3)
+    if items is None:
+        items = [
             {
                 "id": c.id,
                 "title": c.title,
-                "description": c.description[:160],
+                "description": c.description,
                 "school": c.school,
-                "current_amount": float(c.current_amount),
-                "goal_amount": float(c.goal_amount),
-                # 👇 split tags into a list of strings
-                "tags": [t.strip() for t in (c.tags or "").split(",") if t.strip()],
+                "current_amount": c.current_amount,
+                "goal_amount": c.goal_amount,
+                "tags": c.tag_names,
+            }
+            for c in Campaign.objects.filter(is_active=True)
+            .order_by(*keyset_ordering("trending"))
+            .prefetch_related(tag_prefetch())[:3]
+        ]
+    return {
+        "items": [
+            {
+                "id": c["id"],
+                "title": c["title"],
+                "description": c["description"][:160],
+                "school": c["school"],
+                "current_amount": float(c["current_amount"]),
+                "goal_amount": float(c["goal_amount"]),
+                "tags": c["tags"],
             }
             for c in items
         ]
     }
+
+
+def _leaderboard_spotlight(count):
+    """Top `count` active campaigns from the trending leaderboard, or None if it can't tell."""
+    board = get_trending_leaderboard()
+    if board is None:
+        return None
+    items = list(islice((e for e in board["entries"] if e["is_active"]), count))
+    if len(items) < count and not board["complete"]:
+        return None
+    return items
+
+
 # Note: recompute_trending_scores() moved to services.py
 
 
+def _anonymous(request):
+    # last in an auth list: lets requests without a token through as AnonymousUser
+    return AnonymousUser()
+
+
+# Engagement ingestion: buffered in process, written as batched F() updates
+@router.post("/{campaign_id}/engagement", response={202: dict}, auth=[jwt_claims_auth, _anonymous])
+def record_engagement(request, campaign_id: int, payload: EngagementIn):
+    """
+    Views may be anonymous and batched (`count` up to 100). Likes, comments and
+    saves feed the trending score and user_score, so they need a token and
+    count one at a time.
+    """
+    if payload.event not in ENGAGEMENT_EVENTS:
+        raise HttpError(400, f"Unknown event: {payload.event}")
+    if payload.event in ANONYMOUS_EVENTS:
+        if not 1 <= payload.count <= 100:
+            raise HttpError(400, "count must be between 1 and 100")
+    else:
+        if not request.auth.is_authenticated:
+            raise HttpError(401, f"{payload.event} requires authentication")
+        if payload.count != 1:
+            raise HttpError(400, f"count must be 1 for {payload.event}")
+    # buffered increments for unknown ids would never be written anywhere
+    if not Campaign.objects.filter(pk=campaign_id).exists():
+        raise Http404("No Campaign matches the given query.")
+    engagement_buffer.record(campaign_id, payload.event, payload.count)
+    return 202, {"queued": True}
+
+
+# Typeahead for the search box, served from the in-process prefix index
+@router.get("/suggest", response=SuggestResponse)
+def suggest_campaigns(request, prefix: str = "", limit: int = 8):
+    return {"items": suggest_index.suggest(prefix, max(1, min(limit, 20)))}
+
+
 @router.get("/search", response=SearchResponse)
 def search_campaigns(
     request,
@@ -157,72 +257,154 @@ def search_campaigns(
     min_goal: Optional[int] = None,
     max_goal: Optional[int] = None,
     sort: str = "relevance",
-    page: int = 1,
-    page_size: int = 12,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(12, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    facets: Optional[str] = None,
 ):
+    """
+    Offset pagination by default (`page`). Pass `cursor` (empty for the first
+    page, then the returned `next_cursor`) for keyset pagination on the
+    new/funded/trending sorts: constant cost per page and no COUNT(*).
+
+    `facets=tags,school,goal` adds counts per facet over the whole filtered set.
+
+    Items are the precomputed cards of the read model (campaigns/readmodel.py).
+    Pages are cached by their canonical parameters (see campaigns/cache.py);
+    unfiltered sort=trending pages within the top-K come from the leaderboard
+    (see campaigns/leaderboard.py).
+    """
+    filters = normalize_filters(q, tags, school, min_goal, max_goal)
+    if not filters["q"]:
+        # no word tokens (e.g. only punctuation): browse, as for an empty q
+        q = ""
+    facet_names = parse_facets(facets)
+
+    # Leading pages of the unfiltered trending sort come from the top-K leaderboard
+    if sort == "trending" and not facet_names and not any(filters.values()):
+        data = _leaderboard_page(page, page_size, cursor)
+        if data is not None:
+            return _render_page(data)
+
+    key = search_page_key(filters, sort, page, page_size, cursor, facet_names)
+    data = get_cached_page(key)
+    if data is None:
+        qs = _filtered_campaigns(q, tags, school, min_goal, max_goal)
+        data = _search_page(qs, filters, q, sort, page, page_size, cursor)
+        if facet_names:
+            data["facets"] = compute_facets(qs, facet_names)
+        set_cached_page(key, sort, data)
+    return _render_page(data)
+
+
+def _filtered_campaigns(q, tags, school, min_goal, max_goal):
     qs = Campaign.objects.all()
 
-    # Basic text search
+    # Full-text search (FTS5 on SQLite, tsvector on Postgres), annotates search_rank
     if q:
-        qs = qs.filter(
-            Q(title__icontains=q)
-            | Q(description__icontains=q)
-            | Q(school__icontains=q)
-            | Q(tags__icontains=q)  # adjust if tags is ArrayField
-        )
+        qs = get_search_backend().search(qs, q)
 
+    # Exact tag intersection over the (tag, campaign) index
     if tags:
-        wanted = [t.strip() for t in tags.split(",") if t.strip()]
-        for t in wanted:
-            qs = qs.filter(tags__icontains=t)
+        qs = filter_by_tags(qs, split_tags(tags))
 
     if school:
-        qs = qs.filter(school__icontains=school)
+        qs = qs.filter(school__icontains=school.strip())
 
     if min_goal is not None:
         qs = qs.filter(goal_amount__gte=min_goal)
     if max_goal is not None:
         qs = qs.filter(goal_amount__lte=max_goal)
 
-    # Sorting
-    if sort == "new":
-        qs = qs.order_by("-created_at")
-    elif sort == "funded":
-        qs = qs.order_by("-current_amount")
-    elif sort == "trending":
-        qs = qs.order_by("-trending_score") 
-
-    
-
-    paginator = Paginator(qs, page_size)
-    page_obj = paginator.get_page(page)
-
-    items = []
-    for c in page_obj.object_list:
-        # Compute days left based on end_date
-        days_left = 0
-        if c.end_date:
-            delta = (c.end_date - now().date()).days
-            days_left = max(delta, 0)
-
-        items.append({
-            "id": c.id,
-            "title": c.title,
-            "description": c.description,
-            "school": c.school,
-            "current_amount": c.current_amount,
-            "goal_amount": c.goal_amount,
-            "tags": _csv_to_list(c.tags) or [],
-            "cover_image": getattr(c, "cover_image", None),  
-            "backers": getattr(c, "backers", 0),            
-            "days_left": days_left,
-        })
-    print("school param:", repr(school))
-    print("Query:", str(qs.query))
+    return qs
+
+
+def _search_page(qs, filters, q, sort, page, page_size, cursor):
+    # only ids and sort keys are loaded; the items are precomputed cards
+    if sort in KEYSET_SORTS:
+        qs = qs.only("id", KEYSET_SORTS[sort][0])
+    else:
+        qs = qs.only("id")
+
+    if cursor is not None:
+        rows, next_cursor = keyset_page(qs, sort, cursor, page_size)
+        return {
+            "items": get_cards([c.id for c in rows]),
+            "total": None,
+            "total_exact": False,
+            "page": None,
+            "page_size": page_size,
+            "next_cursor": next_cursor,
+        }
+
+    # Sorting (new/funded/trending share the keyset indexes' ordering)
+    if sort in KEYSET_SORTS:
+        qs = qs.order_by(*keyset_ordering(sort))
+    elif q:
+        qs = qs.order_by("-search_rank", "-id")
+
+    # Sliced directly rather than through Paginator, whose page validation
+    # needs an exact COUNT(*); the total comes from the count strategy instead.
+    total, total_exact = count_results(qs, filters)
+    start = (page - 1) * page_size
 
     return {
-        "items": items,
-        "total": paginator.count,
-        "page": page_obj.number,
-        "page_size": page_obj.paginator.per_page,
-    }
\ No newline at end of file
+        "items": get_cards([c.id for c in qs[start:start + page_size]]),
+        "total": total,
+        "total_exact": total_exact,
+        "page": page,
+        "page_size": page_size,
+    }
+
+
+def _render_page(data):
+    """
+    SearchResponse JSON with the (already serialized) item cards spliced in,
+    rather than rebuilding and re-validating every item.
+    """
+    meta = {"next_cursor": None, "facets": None, **data}
+    items = meta.pop("items")
+    head = json.dumps(meta, cls=NinjaJSONEncoder)
+    return HttpResponse(f'{{"items": [{", ".join(items)}], {head[1:]}', content_type="application/json")
+
+
+def _leaderboard_page(page, page_size, cursor):
+    """A sort=trending page sliced from the leaderboard snapshot, or None if it isn't covered."""
+    board = get_trending_leaderboard()
+    if board is None:
+        return None
+
+    if cursor is None:
+        entries = leaderboard_slice(board, (page - 1) * page_size, page_size)
+        if entries is None:
+            return None
+        return {
+            "items": [_leaderboard_card(e) for e in entries],
+            "total": board["total"],
+            "total_exact": board["total_exact"],
+            "page": page,
+            "page_size": page_size,
+        }
+
+    start = leaderboard_position(board, *decode_cursor(cursor, "trending")) if cursor else 0
+    # one extra entry tells whether there is a next page, as in keyset_page()
+    entries = leaderboard_slice(board, start, page_size + 1)
+    if entries is None:
+        return None
+    next_cursor = None
+    if len(entries) > page_size:
+        entries = entries[:page_size]
+        next_cursor = encode_cursor("trending", entries[-1]["score"], entries[-1]["id"])
+    return {
+        "items": [_leaderboard_card(e) for e in entries],
+        "total": None,
+        "total_exact": False,
+        "page": None,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+    }
+
+
+def _leaderboard_card(e):
+    # entries carry their read-model card; one not built yet is rendered from the entry
+    return e["card"] or card_json({**e, "cover_image": None, "backers": 0})
@@ -4,3 +4,16 @@ from django.apps import AppConfig
 class CampaignsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'campaigns'
+
+    def ready(self):
+        import atexit
+
+        from django.db.models.signals import post_migrate
+
+        from . import signals  # noqa: F401
+        from .engagement import engagement_buffer
+        from .search import ensure_fts_triggers
+
+        post_migrate.connect(ensure_fts_triggers, sender=self)
+        # write out buffered engagement counters on shutdown
+        atexit.register(engagement_buffer.flush)
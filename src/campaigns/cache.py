@@ -0,0 +1,98 @@
+# campaigns/cache.py
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+# Any configured Django cache works (locmem per process, Redis to share across workers).
+SEARCH_CACHE_ALIAS = getattr(settings, "CAMPAIGN_SEARCH_CACHE_ALIAS", "default")
+# Lifetime of a cached page for sorts that are invalidated by writes.
+SEARCH_CACHE_TTL = getattr(settings, "CAMPAIGN_SEARCH_CACHE_TTL", 300)
+# Trending pages ignore write invalidation (scores churn constantly) and are
+# instead served for at most this many seconds.
+TRENDING_MAX_STALENESS = getattr(settings, "CAMPAIGN_SEARCH_TRENDING_MAX_STALENESS", 30)
+# Lifetime of a cached campaign_detail body; dropped early when the campaign or its team changes.
+DETAIL_CACHE_TTL = getattr(settings, "CAMPAIGN_DETAIL_CACHE_TTL", 300)
+
+VERSION_KEY = "campaigns:search:version"
+
+
+def search_cache():
+    return caches[SEARCH_CACHE_ALIAS]
+
+
+def get_search_version() -> int:
+    cache = search_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # seed from the clock so an evicted counter never reuses an old version
+        cache.add(VERSION_KEY, int(time.time() * 1000), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_search_version():
+    """
+    Invalidate every cached search page. Runs automatically when a Campaign is
+    saved or deleted; call it yourself after queryset.update() on campaigns.
+    """
+    cache = search_cache()
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, int(time.time() * 1000), None)
+
+
+def search_page_key(filters: dict, sort: str, page: int, page_size: int, cursor, facets=()) -> str:
+    params = {
+        **filters,
+        "sort": sort,
+        "page": page,
+        "page_size": page_size,
+        "cursor": cursor,
+        "facets": list(facets),
+    }
+    if sort != "trending":
+        params["version"] = get_search_version()
+    digest = hashlib.sha1(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+    return f"campaigns:search:page:{digest}"
+
+
+def get_cached_page(key: str):
+    return search_cache().get(key)
+
+
+def set_cached_page(key: str, sort: str, data: dict):
+    ttl = TRENDING_MAX_STALENESS if sort == "trending" else SEARCH_CACHE_TTL
+    search_cache().set(key, data, ttl)
+
+
+def detail_cache_key(campaign_id: int) -> str:
+    return f"campaigns:detail:{campaign_id}"
+
+
+def get_cached_detail(campaign_id: int):
+    """{"etag", "last_modified", "body"} for a campaign_detail response, or None."""
+    return search_cache().get(detail_cache_key(campaign_id))
+
+
+def set_cached_detail(campaign_id: int, entry: dict):
+    search_cache().set(detail_cache_key(campaign_id), entry, DETAIL_CACHE_TTL)
+
+
+def get_cached_details(campaign_ids) -> dict:
+    """campaign id -> cached detail entry, for the ids that are cached (one round trip)."""
+    found = search_cache().get_many([detail_cache_key(i) for i in campaign_ids])
+    return {i: found[detail_cache_key(i)] for i in campaign_ids if detail_cache_key(i) in found}
+
+
+def set_cached_details(entries: dict):
+    search_cache().set_many(
+        {detail_cache_key(i): entry for i, entry in entries.items()}, DETAIL_CACHE_TTL
+    )
+
+
+def invalidate_detail(campaign_id: int):
+    search_cache().delete(detail_cache_key(campaign_id))
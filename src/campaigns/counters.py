@@ -0,0 +1,73 @@
+# campaigns/counters.py
+"""
+Platform-wide totals for /campaigns/stats, stored in the PlatformCounters row
+and adjusted incrementally (campaigns/signals.py, payments/signals.py) inside
+the transaction that makes the change, so reading them is a single-row fetch.
+"""
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import Campaign, PlatformCounters
+
+COUNTERS_PK = 1
+
+
+def rebuild_platform_counters() -> PlatformCounters:
+    """Recount everything from the source tables (first use, or after bulk changes)."""
+    from payments.models import Transaction  # payments depends on campaigns
+
+    counters, _ = PlatformCounters.objects.update_or_create(
+        pk=COUNTERS_PK,
+        defaults={
+            "active_projects": Campaign.objects.filter(is_active=True).count(),
+            "active_creators": get_user_model().objects.filter(is_active=True).count(),
+            "funds_raised": Decimal(
+                str(Transaction.objects.aggregate(total=Sum("amount"))["total"] or 0)
+            ).quantize(Decimal("0.01")),
+        },
+    )
+    return counters
+
+
+def get_platform_counters() -> PlatformCounters:
+    counters = PlatformCounters.objects.filter(pk=COUNTERS_PK).first()
+    return counters if counters is not None else rebuild_platform_counters()
+
+
+def adjust_platform_counters(active_projects=0, active_creators=0, funds_raised=0):
+    """Apply deltas with one UPDATE ... SET col = col + delta on the counters row."""
+    deltas = {
+        "active_projects": active_projects,
+        "active_creators": active_creators,
+        "funds_raised": Decimal(str(funds_raised)),
+    }
+    deltas = {column: delta for column, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    updated = PlatformCounters.objects.filter(pk=COUNTERS_PK).update(
+        **{column: F(column) + delta for column, delta in deltas.items()},
+        updated_at=timezone.now(),
+    )
+    if not updated:
+        # no row yet: counting the tables now already includes this change
+        rebuild_platform_counters()
+
+
+def activation_delta(instance, created: bool, update_fields=None) -> int:
+    """+1 / -1 / 0 for an is_active transition of a just-saved Campaign or User."""
+    if created:
+        return 1 if instance.is_active else 0
+    if update_fields is not None and "is_active" not in update_fields:
+        return 0
+    # post_save runs before DirtyFieldsMixin records the saved values
+    was_active = instance.loaded_value("is_active")
+    if was_active is None:
+        # is_active was deferred when loaded, so the transition is unknown: recount
+        rebuild_platform_counters()
+        return 0
+    if was_active == instance.is_active:
+        return 0
+    return 1 if instance.is_active else -1
@@ -0,0 +1,69 @@
+# campaigns/counting.py
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+
+from .models import Campaign
+
+# Result sets up to this size are always counted exactly (a bounded probe).
+EXACT_COUNT_LIMIT = getattr(settings, "CAMPAIGN_SEARCH_EXACT_COUNT_LIMIT", 1000)
+# How long a full COUNT(*) for a given filter set is reused.
+COUNT_CACHE_TTL = getattr(settings, "CAMPAIGN_SEARCH_COUNT_CACHE_TTL", 60)
+
+
+def count_cache_key(filters: dict) -> str:
+    digest = hashlib.sha1(json.dumps(filters, sort_keys=True).encode()).hexdigest()
+    return f"campaigns:search:count:{digest}"
+
+
+def estimate_table_rows(model=Campaign):
+    """
+    Row count from the planner's statistics, or None if there are none yet.
+    Postgres: pg_class.reltuples (kept fresh by autovacuum/ANALYZE).
+    SQLite: sqlite_stat1, only present after ANALYZE.
+    """
+    table = model._meta.db_table
+    try:
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table])
+                row = cursor.fetchone()
+                return row[0] if row and row[0] >= 0 else None
+            if connection.vendor == "sqlite":
+                cursor.execute("SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table])
+                row = cursor.fetchone()
+                return int(row[0].split()[0]) if row else None
+    except DatabaseError:
+        return None
+    return None
+
+
+def count_results(qs, filters: dict) -> tuple[int, bool]:
+    """
+    Total for a search result set, as (total, exact):
+
+    - unfiltered browse over a large table: planner estimate, not exact
+    - up to EXACT_COUNT_LIMIT rows: exact, via a LIMITed probe
+    - anything bigger: full COUNT(*), cached per normalized filter set;
+      a cache hit may be up to COUNT_CACHE_TTL stale, so it is reported as not exact
+    """
+    if not any(filters.values()):
+        estimate = estimate_table_rows()
+        if estimate is not None and estimate > EXACT_COUNT_LIMIT:
+            return estimate, False
+
+    qs = qs.order_by()
+    probe = qs.values("pk")[: EXACT_COUNT_LIMIT + 1].count()
+    if probe <= EXACT_COUNT_LIMIT:
+        return probe, True
+
+    key = count_cache_key(filters)
+    total = cache.get(key)
+    if total is not None:
+        return total, False
+    total = qs.count()
+    cache.set(key, total, COUNT_CACHE_TTL)
+    return total, True
@@ -0,0 +1,108 @@
+# campaigns/engagement.py
+import logging
+import os
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Campaign
+
+logger = logging.getLogger(__name__)
+
+# event name -> Campaign counter column
+ENGAGEMENT_EVENTS = {
+    "view": "view_count",
+    "like": "like_count",
+    "comment": "comment_count",
+    "save": "recruiter_saves",
+}
+# events accepted without authentication (see campaigns/api.py record_engagement)
+ANONYMOUS_EVENTS = {"view"}
+
+# A buffer is flushed once it is this old or holds this many events (checked on
+# each record() and by a per-process timer thread), so a crashed worker loses at
+# most FLUSH_SECONDS / MAX_PENDING worth of increments.
+FLUSH_SECONDS = getattr(settings, "CAMPAIGN_ENGAGEMENT_FLUSH_SECONDS", 10)
+MAX_PENDING = getattr(settings, "CAMPAIGN_ENGAGEMENT_MAX_PENDING", 1000)
+
+
+class EngagementBuffer:
+    """
+    Write-behind counters: increments accumulate in process and are written as
+    one UPDATE ... SET col = col + n per campaign per flush. Flushed when full,
+    when old, every FLUSH_SECONDS by a daemon thread even if traffic stops, and
+    at interpreter exit (see CampaignsConfig.ready).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = {}  # campaign id -> Counter(column -> increment)
+        self._events = 0
+        self._started_at = time.monotonic()
+        self._flusher_pid = None
+
+    def _ensure_flusher(self):
+        # started lazily, and again after a fork (threads don't survive one)
+        if self._flusher_pid == os.getpid():
+            return
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+        threading.Thread(target=self._flush_periodically, name="engagement-flush", daemon=True).start()
+
+    def _flush_periodically(self):
+        while True:
+            time.sleep(FLUSH_SECONDS)
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("periodic engagement flush failed")
+            finally:
+                close_old_connections()
+
+    def record(self, campaign_id: int, event: str, count: int = 1):
+        column = ENGAGEMENT_EVENTS[event]
+        self._ensure_flusher()
+        with self._lock:
+            self._pending.setdefault(campaign_id, Counter())[column] += count
+            self._events += count
+            due = self._events >= MAX_PENDING or time.monotonic() - self._started_at >= FLUSH_SECONDS
+        if due:
+            self.flush()
+
+    def _take(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._events = 0
+            self._started_at = time.monotonic()
+        return pending
+
+    def flush(self) -> int:
+        """Write out everything buffered so far; returns the number of campaigns updated."""
+        pending = self._take()
+        if not pending:
+            return 0
+        now = timezone.now()
+        try:
+            # all or nothing, so a failure loses exactly the batch it reports
+            with transaction.atomic():
+                for campaign_id, increments in pending.items():
+                    Campaign.objects.filter(pk=campaign_id).update(
+                        **{column: F(column) + n for column, n in increments.items()},
+                        last_activity_at=now,
+                        trending_dirty=True,
+                    )
+        except DatabaseError:
+            # dropped rather than re-queued, keeping the loss bounded to one batch
+            logger.exception("engagement flush failed, %d campaigns' increments lost", len(pending))
+            return 0
+        return len(pending)
+
+
+engagement_buffer = EngagementBuffer()
@@ -0,0 +1,87 @@
+# campaigns/facets.py
+from django.db.models import Case, CharField, Count, F, Q, Value, When
+from ninja.errors import HttpError
+
+from .models import Campaign, CampaignTag
+
+FACET_LIMIT = 20
+
+# (label, lower bound inclusive, upper bound exclusive or None)
+GOAL_BUCKETS = [
+    ("0-1000", 0, 1000),
+    ("1000-5000", 1000, 5000),
+    ("5000-10000", 5000, 10000),
+    ("10000+", 10000, None),
+]
+
+
+def parse_facets(value: str | None) -> list[str]:
+    names = sorted({f.strip() for f in (value or "").split(",") if f.strip()})
+    unknown = [n for n in names if n not in FACETS]
+    if unknown:
+        raise HttpError(400, f"Unknown facet(s): {', '.join(unknown)}")
+    return names
+
+
+# Each facet is a (facet, value, count) grouped query; compute_facets() runs the
+# requested ones as a single UNION ALL.
+
+def _grouped(qs, facet, value):
+    return (
+        qs.order_by()
+        .annotate(value=value)
+        .values("value")
+        .annotate(facet=Value(facet, output_field=CharField()), count=Count("id"))
+        .values_list("facet", "value", "count")
+    )
+
+
+def _tag_rows(ids):
+    # grouped over the (campaign_id) index of the join table
+    return _grouped(CampaignTag.objects.filter(campaign_id__in=ids), "tags", F("tag__name"))
+
+
+def _school_rows(ids):
+    qs = Campaign.objects.filter(id__in=ids).exclude(school__isnull=True).exclude(school="")
+    return _grouped(qs, "school", F("school"))
+
+
+def _goal_rows(ids):
+    buckets = []
+    for label, low, high in GOAL_BUCKETS:
+        cond = Q(goal_amount__gte=low)
+        if high is not None:
+            cond &= Q(goal_amount__lt=high)
+        buckets.append(When(cond, then=Value(label)))
+    return _grouped(Campaign.objects.filter(id__in=ids), "goal", Case(*buckets, output_field=CharField()))
+
+
+def _top(counts: dict) -> list[dict]:
+    rows = sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:FACET_LIMIT]
+    return [{"value": value, "count": count} for value, count in rows]
+
+
+def _buckets(counts: dict) -> list[dict]:
+    # every bucket, in order, including empty ones
+    return [{"value": label, "count": counts.get(label, 0)} for label, _, _ in GOAL_BUCKETS]
+
+
+# facet name -> (grouped rows query, formatter)
+FACETS = {
+    "tags": (_tag_rows, _top),
+    "school": (_school_rows, _top),
+    "goal": (_goal_rows, _buckets),
+}
+
+
+def compute_facets(qs, names: list[str]) -> dict:
+    """Counts for each requested facet over the whole filtered result set `qs`, in one query."""
+    if not names:
+        return {}
+    ids = qs.order_by().values("id")
+    first, *rest = [FACETS[name][0](ids) for name in names]
+    counts = {name: {} for name in names}
+    for facet, value, count in first.union(*rest, all=True):
+        if value is not None:
+            counts[facet][value] = count
+    return {name: FACETS[name][1](counts[name]) for name in names}
@@ -0,0 +1,49 @@
+# campaigns/fts.py
+"""
+SQL for the SQLite FTS5 index over campaigns, shared by migration 0006 and
+search.ensure_fts_triggers(). Kept free of model imports so the migration can
+use it.
+
+The triggers keep the external-content table in sync, so bulk writes and raw
+SQL stay indexed too. The update trigger only fires when a searchable column
+actually changed, so counter/score updates never reindex.
+"""
+
+CREATE_FTS_TABLE = """
+    CREATE VIRTUAL TABLE campaigns_campaign_fts USING fts5(
+        title, description, school, tags,
+        content='campaigns_campaign', content_rowid='id'
+    )
+    """
+
+# trigger name -> CREATE TRIGGER IF NOT EXISTS statement
+FTS_TRIGGERS = {
+    "campaigns_campaign_fts_ai": """
+    CREATE TRIGGER IF NOT EXISTS campaigns_campaign_fts_ai AFTER INSERT ON campaigns_campaign BEGIN
+        INSERT INTO campaigns_campaign_fts(rowid, title, description, school, tags)
+        VALUES (new.id, new.title, new.description, new.school, new.tags);
+    END
+    """,
+    "campaigns_campaign_fts_ad": """
+    CREATE TRIGGER IF NOT EXISTS campaigns_campaign_fts_ad AFTER DELETE ON campaigns_campaign BEGIN
+        INSERT INTO campaigns_campaign_fts(campaigns_campaign_fts, rowid, title, description, school, tags)
+        VALUES ('delete', old.id, old.title, old.description, old.school, old.tags);
+    END
+    """,
+    "campaigns_campaign_fts_au": """
+    CREATE TRIGGER IF NOT EXISTS campaigns_campaign_fts_au AFTER UPDATE ON campaigns_campaign
+    WHEN old.title IS NOT new.title
+      OR old.description IS NOT new.description
+      OR old.school IS NOT new.school
+      OR old.tags IS NOT new.tags
+    BEGIN
+        INSERT INTO campaigns_campaign_fts(campaigns_campaign_fts, rowid, title, description, school, tags)
+        VALUES ('delete', old.id, old.title, old.description, old.school, old.tags);
+        INSERT INTO campaigns_campaign_fts(rowid, title, description, school, tags)
+        VALUES (new.id, new.title, new.description, new.school, new.tags);
+    END
+    """,
+}
+
+# reindex every campaign from the content table
+REBUILD_FTS = "INSERT INTO campaigns_campaign_fts(campaigns_campaign_fts) VALUES ('rebuild')"
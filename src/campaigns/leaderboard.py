@@ -0,0 +1,111 @@
+# campaigns/leaderboard.py
+"""
+Materialized top-K trending leaderboard.
+
+recompute_trending_scores() publishes the K highest-scoring campaigns (active
+or not, each entry carries its is_active flag) as one snapshot in the search
+cache. Spotlight and the leading pages of sort=trending are then served from
+it without touching the database. Snapshots live for
+CAMPAIGN_SEARCH_TRENDING_MAX_STALENESS, like cached trending pages, so they are
+never staler than the database path would be.
+
+The recompute usually runs in a Celery worker, so its snapshot only reaches
+web processes through a shared cache (CAMPAIGN_SEARCH_CACHE_ALIAS on Redis or
+similar). When a reader finds no snapshot (expired, or never seen with the
+per-process locmem default) it builds one itself.
+"""
+import uuid
+from bisect import bisect_right
+
+from django.conf import settings
+from django.db.models import F
+
+from .cache import TRENDING_MAX_STALENESS, search_cache
+from .counting import count_results
+from .models import Campaign, CampaignTag
+from .pagination import KEYSET_SORTS, keyset_ordering
+
+LEADERBOARD_SIZE = getattr(settings, "CAMPAIGN_TRENDING_LEADERBOARD_SIZE", 500)
+
+POINTER_KEY = "campaigns:trending:leaderboard"
+REBUILD_LOCK_KEY = f"{POINTER_KEY}:rebuilding"
+
+ENTRY_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "school",
+    "current_amount",
+    "goal_amount",
+    "is_active",
+)
+
+
+def build_trending_leaderboard(size: int = LEADERBOARD_SIZE) -> dict:
+    """Read the top `size` campaigns off the trending keyset index (two queries plus the total)."""
+    column, _ = KEYSET_SORTS["trending"]
+    entries = list(
+        Campaign.objects.order_by(*keyset_ordering("trending"))
+        .values(*ENTRY_FIELDS, score=F(column), card=F("read_model__card"))[:size]
+    )
+    tags = {}
+    for campaign_id, name in (
+        CampaignTag.objects.filter(campaign_id__in=[e["id"] for e in entries])
+        .order_by("id")
+        .values_list("campaign_id", "tag__name")
+    ):
+        tags.setdefault(campaign_id, []).append(name)
+    for entry in entries:
+        entry["tags"] = tags.get(entry["id"], [])
+
+    total, total_exact = count_results(Campaign.objects.all(), {})
+    return {
+        "entries": entries,
+        # the snapshot holds every campaign, so any page of it can be served
+        "complete": len(entries) < size,
+        "total": total,
+        "total_exact": total_exact,
+    }
+
+
+def publish_trending_leaderboard(size: int = LEADERBOARD_SIZE) -> dict:
+    """
+    Build a fresh snapshot under its own key, then swap the pointer to it, so
+    readers see either the old or the new leaderboard and never a mix.
+    """
+    snapshot = build_trending_leaderboard(size)
+    cache = search_cache()
+    snapshot_key = f"{POINTER_KEY}:{uuid.uuid4().hex}"
+    cache.set(snapshot_key, snapshot, TRENDING_MAX_STALENESS)
+    cache.set(POINTER_KEY, snapshot_key, TRENDING_MAX_STALENESS)
+    return snapshot
+
+
+def get_trending_leaderboard(rebuild: bool = True) -> dict | None:
+    """
+    The current snapshot; on a miss, build one unless another reader already is.
+    None then, and the caller falls back to the database.
+    """
+    cache = search_cache()
+    snapshot_key = cache.get(POINTER_KEY)
+    snapshot = cache.get(snapshot_key) if snapshot_key else None
+    if snapshot is None and rebuild and cache.add(REBUILD_LOCK_KEY, True, 30):
+        try:
+            snapshot = publish_trending_leaderboard()
+        finally:
+            cache.delete(REBUILD_LOCK_KEY)
+    return snapshot
+
+
+def leaderboard_slice(snapshot: dict, start: int, count: int) -> list[dict] | None:
+    """entries[start:start + count], or None if the snapshot can't answer for that range."""
+    entries = snapshot["entries"]
+    if start + count > len(entries) and not snapshot["complete"]:
+        return None
+    return entries[start:start + count]
+
+
+def leaderboard_position(snapshot: dict, score: float, pk: int) -> int:
+    """Index of the first entry strictly after (score, pk) in (score DESC, id DESC) order."""
+    keys = [(-e["score"], -e["id"]) for e in snapshot["entries"]]
+    return bisect_right(keys, (-score, -pk))
@@ -0,0 +1,79 @@
+# campaigns/management/commands/bench_renderers.py
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from campaigns.readmodel import DETAIL_IMAGES
+from campaigns.schemas import SearchResponse
+from Core.renderers import RENDERERS, get_renderer
+
+
+def search_payload(page_size):
+    """A search page as django-ninja hands it to the renderer (validated, then dumped)."""
+    items = [
+        {
+            "id": i,
+            "title": f"Campaign {i}: a robotics kit for the school makerspace",
+            "description": "Help us build and program robots for our regional competition. " * 4,
+            "school": "Lincoln High School",
+            "current_amount": Decimal("1234.00") + i,
+            "goal_amount": Decimal("5000.00"),
+            "tags": ["robotics", "stem", "competition"],
+            "cover_image": None,
+            "backers": i,
+        }
+        for i in range(page_size)
+    ]
+    data = {"items": items, "total": 1000, "total_exact": True, "page": 1, "page_size": page_size}
+    return SearchResponse.model_validate(data).model_dump()
+
+
+def detail_payload():
+    now = timezone.now()
+    return {
+        "id": 1,
+        "title": "A robotics kit for the school makerspace",
+        "school": "Lincoln High School",
+        "description": "Help us build and program robots for our regional competition. " * 20,
+        "goal_amount": Decimal("5000.00"),
+        "current_amount": Decimal("1234.50"),
+        "tags": ["robotics", "stem", "competition"],
+        "images": DETAIL_IMAGES,
+        "creator": {"id": 1, "name": "creator"},
+        "team_members": [{"id": i, "name": f"member{i}"} for i in range(2, 8)],
+        "is_sponsored": False,
+        "sponsored_by": None,
+        "created_at": now - timedelta(days=10),
+        "updated_at": now,
+        "end_date": (now + timedelta(days=20)).date(),
+        "milestones": [{"title": f"Milestone {i}", "done": i < 2} for i in range(5)],
+        "verified": True,
+    }
+
+
+class Command(BaseCommand):
+    help = "Compare the API response renderers (see Core/renderers.py) on search and detail payloads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page-sizes", type=int, nargs="+", default=[12, 50, 200])
+        parser.add_argument("--iterations", type=int, default=2000)
+
+    def handle(self, *args, page_sizes, iterations, **options):
+        payloads = [(f"search page_size={n}", search_payload(n)) for n in page_sizes]
+        payloads.append(("detail", detail_payload()))
+        renderers = {name: get_renderer(name) for name in RENDERERS}
+
+        for label, payload in payloads:
+            timings = {}
+            for name, renderer in renderers.items():
+                renderer.render(None, payload, response_status=200)  # warm up
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    renderer.render(None, payload, response_status=200)
+                timings[name] = (time.perf_counter() - start) / iterations * 1e6
+            summary = "  ".join(f"{name} {us:8.1f}us" for name, us in timings.items())
+            speedup = timings["json"] / timings["orjson"]
+            self.stdout.write(f"{label:<22} {summary}  ({speedup:.1f}x)")
@@ -0,0 +1,54 @@
+# campaigns/management/commands/export_campaigns.py
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Prefetch
+
+from campaigns.models import Campaign
+from Core.bulkio import FORMATS, Progress, RowWriter, chunked, detect_format, open_stream
+
+from .import_campaigns import FIELDS
+
+
+def campaign_row(c) -> dict:
+    return {
+        "title": c.title,
+        "description": c.description,
+        "school": c.school,
+        "tags": c.tags,
+        "goal_amount": c.goal_amount,
+        "current_amount": c.current_amount,
+        "creator": c.creator.email,
+        "team_members": [u.email for u in c.team_members.all()],
+        "sponsored_by": c.sponsored_by,
+        "milestones": c.milestones,
+        "is_active": c.is_active,
+        "end_date": c.end_date,
+    }
+
+
+class Command(BaseCommand):
+    help = "Stream all campaigns to CSV or JSONL, in the columns import_campaigns reads."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", default="-", help='output file, or "-" (default) for stdout')
+        parser.add_argument("--format", choices=FORMATS)
+        parser.add_argument("--chunk-size", type=int, default=2000)
+
+    def handle(self, *args, path, format, chunk_size, **options):
+        progress = Progress(self.stderr, "exported")
+        # the team prefetch runs once per chunk, so memory is bounded by chunk_size
+        campaigns = (
+            Campaign.objects.order_by("id")
+            .select_related("creator")
+            .only(*[f for f in FIELDS if f not in ("creator", "team_members")], "creator__email")
+            .prefetch_related(Prefetch("team_members", queryset=get_user_model().objects.only("email")))
+            .iterator(chunk_size=chunk_size)
+        )
+
+        with open_stream(path, "w") as stream:
+            writer = RowWriter(stream, detect_format(path, format), FIELDS)
+            for chunk in chunked(campaigns, chunk_size):
+                for c in chunk:
+                    writer.write(campaign_row(c))
+                progress.add(len(chunk))
+        progress.done("campaigns")
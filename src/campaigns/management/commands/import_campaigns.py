@@ -0,0 +1,136 @@
+# campaigns/management/commands/import_campaigns.py
+from decimal import Decimal, InvalidOperation
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_date
+
+from campaigns.cache import bump_search_version
+from campaigns.counters import rebuild_platform_counters
+from campaigns.models import Campaign
+from campaigns.readmodel import refresh_read_models
+from campaigns.services import add_campaign_tags
+from Core.bulkio import FORMATS, Progress, as_bool, as_json, as_list, chunked, detect_format, open_stream, read_rows
+
+# creator and team_members are user emails
+FIELDS = [
+    "title", "description", "school", "tags", "goal_amount", "current_amount",
+    "creator", "team_members", "sponsored_by", "milestones", "is_active", "end_date",
+]
+REQUIRED = ("title", "description", "goal_amount", "creator")
+
+
+def _decimal(line_no, field, value, default=None):
+    if value in (None, ""):
+        return default
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        raise CommandError(f"line {line_no}: {field} is not a number: {value!r}")
+
+
+def _date(line_no, field, value):
+    if value in (None, ""):
+        return None
+    try:
+        # JSONL may carry a number; parse_date raises ValueError for e.g. 2030-02-30
+        parsed = parse_date(value) if isinstance(value, str) else None
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise CommandError(f"line {line_no}: {field} must be YYYY-MM-DD, not {value!r}")
+    return parsed
+
+
+def _json(line_no, field, value):
+    try:
+        return as_json(value)
+    except ValueError as e:
+        raise CommandError(f"line {line_no}: {field} is not valid JSON ({e})")
+
+
+def build_campaign(line_no, row, user_ids):
+    for field in REQUIRED:
+        if not row.get(field):
+            raise CommandError(f"line {line_no}: {field} is required")
+    if None in row:
+        # csv.DictReader puts cells beyond the header under the key None
+        raise CommandError(f"line {line_no}: too many columns")
+    unknown = set(row) - set(FIELDS)
+    if unknown:
+        raise CommandError(f"line {line_no}: unknown columns {', '.join(sorted(unknown))}")
+
+    emails = [row["creator"], *as_list(row.get("team_members"))]
+    missing = [email for email in emails if email not in user_ids]
+    if missing:
+        raise CommandError(f"line {line_no}: no user with email {', '.join(missing)}")
+
+    end_date = _date(line_no, "end_date", row.get("end_date"))
+    tags = row.get("tags") or ""
+
+    campaign = Campaign(
+        title=row["title"],
+        description=row["description"],
+        school=row.get("school") or None,
+        tags=",".join(tags) if isinstance(tags, list) else tags,
+        goal_amount=_decimal(line_no, "goal_amount", row["goal_amount"]),
+        current_amount=_decimal(line_no, "current_amount", row.get("current_amount"), Decimal(0)),
+        creator_id=user_ids[row["creator"]],
+        sponsored_by=row.get("sponsored_by") or None,
+        milestones=_json(line_no, "milestones", row.get("milestones")),
+        is_active=as_bool(row.get("is_active")),
+        end_date=end_date,
+    )
+    team = {user_ids[email] for email in emails[1:]}
+    return campaign, team
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-create campaigns from CSV or JSONL (columns: " + ", ".join(FIELDS) + "). "
+        "creator and team_members are emails of existing users (team_members ';'-separated in CSV). "
+        "Each chunk is one transaction: the campaigns, their team and tag rows, and their read models."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help='input file, or "-" for stdin')
+        parser.add_argument("--format", choices=FORMATS)
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--defer-read-models", action="store_true",
+            help="Skip building read models; they are built on first read (or by rebuild_read_models)",
+        )
+
+    def handle(self, *args, path, format, chunk_size, defer_read_models, **options):
+        fmt = detect_format(path, format)
+        progress = Progress(self.stderr, "imported")
+        Team = Campaign.team_members.through
+
+        with open_stream(path, "r") as stream:
+            for chunk in chunked(read_rows(stream, fmt), chunk_size):
+                # every user the chunk mentions, in one query
+                emails = {
+                    email
+                    for _, row in chunk
+                    for email in [row.get("creator") or "", *as_list(row.get("team_members"))]
+                    if email
+                }
+                user_ids = dict(get_user_model().objects.filter(email__in=emails).values_list("email", "id"))
+                built = [build_campaign(line_no, row, user_ids) for line_no, row in chunk]
+
+                with transaction.atomic():
+                    campaigns = Campaign.objects.bulk_create([campaign for campaign, _ in built])
+                    Team.objects.bulk_create(
+                        [Team(campaign_id=c.pk, user_id=user_id) for c, team in built for user_id in team]
+                    )
+                    add_campaign_tags(campaigns)
+                    if not defer_read_models:
+                        refresh_read_models([c.pk for c in campaigns])
+                progress.add(len(campaigns))
+
+        # bulk_create skips the post_save signals that keep these current; new rows
+        # are trending_dirty, so the next recompute scores them and the leaderboard
+        rebuild_platform_counters()
+        bump_search_version()
+        progress.done("campaigns")
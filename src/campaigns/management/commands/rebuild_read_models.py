@@ -0,0 +1,26 @@
+# campaigns/management/commands/rebuild_read_models.py
+from django.core.management.base import BaseCommand
+
+from campaigns.cache import bump_search_version, invalidate_detail
+from campaigns.models import Campaign
+from campaigns.readmodel import refresh_read_models
+
+
+class Command(BaseCommand):
+    help = (
+        "Regenerate the pre-serialized campaign read model (card and detail JSON). "
+        "Needed after bulk changes that bypass model signals, e.g. queryset.update()."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, batch_size, **options):
+        ids = list(Campaign.objects.order_by("id").values_list("id", flat=True))
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            refresh_read_models(batch)
+            for campaign_id in batch:
+                invalidate_detail(campaign_id)
+        bump_search_version()
+        self.stdout.write(f"rebuilt {len(ids)} campaign read models")
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from campaigns.fts import CREATE_FTS_TABLE, FTS_TRIGGERS, REBUILD_FTS
+
+# SQLite: external-content FTS5 table over the searchable columns, kept in sync by
+# triggers (campaigns/fts.py, also used to restore them after table rebuilds).
+SQLITE_FORWARD = [
+    CREATE_FTS_TABLE,
+    *FTS_TRIGGERS.values(),
+    # backfill existing campaigns
+    REBUILD_FTS,
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS campaigns_campaign_fts_au",
+    "DROP TRIGGER IF EXISTS campaigns_campaign_fts_ad",
+    "DROP TRIGGER IF EXISTS campaigns_campaign_fts_ai",
+    "DROP TABLE IF EXISTS campaigns_campaign_fts",
+]
+
+# Postgres: weighted tsvector as a stored generated column (always in sync, backfilled
+# on creation) with a GIN index. Not part of the Django model state on purpose.
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE campaigns_campaign ADD COLUMN search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A')
+        || setweight(to_tsvector('english', coalesce(tags, '')), 'B')
+        || setweight(to_tsvector('english', coalesce(school, '')), 'C')
+        || setweight(to_tsvector('english', coalesce(description, '')), 'D')
+    ) STORED
+    """,
+    "CREATE INDEX campaigns_campaign_search_vector_gin ON campaigns_campaign USING GIN (search_vector)",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS campaigns_campaign_search_vector_gin",
+    "ALTER TABLE campaigns_campaign DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+    return run
+
+
+create_search_index = _run({"sqlite": SQLITE_FORWARD, "postgresql": POSTGRES_FORWARD})
+drop_search_index = _run({"sqlite": SQLITE_BACKWARD, "postgresql": POSTGRES_BACKWARD})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0005_campaign_milestones_campaign_sponsored_by_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignSearchDocument',
+            fields=[
+                ('campaign', models.OneToOneField(db_column='rowid', on_delete=django.db.models.deletion.DO_NOTHING, primary_key=True, related_name='search_document', serialize=False, to='campaigns.campaign')),
+                ('document', models.TextField(db_column='campaigns_campaign_fts')),
+            ],
+            options={
+                'db_table': 'campaigns_campaign_fts',
+                'managed': False,
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
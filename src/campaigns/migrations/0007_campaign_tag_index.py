@@ -0,0 +1,68 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_tags(apps, schema_editor):
+    Campaign = apps.get_model("campaigns", "Campaign")
+    Tag = apps.get_model("campaigns", "Tag")
+    CampaignTag = apps.get_model("campaigns", "CampaignTag")
+
+    wanted = {}  # campaign id -> ordered slugs
+    names = {}   # slug -> first-seen display name
+    for campaign_id, csv in Campaign.objects.exclude(tags="").values_list("id", "tags").iterator():
+        slugs = []
+        for name in (t.strip() for t in csv.split(",")):
+            slug = name.lower()[:64]
+            if slug and slug not in slugs:
+                slugs.append(slug)
+                names.setdefault(slug, name[:64])
+        wanted[campaign_id] = slugs
+
+    Tag.objects.bulk_create([Tag(slug=s, name=n) for s, n in names.items()], batch_size=500)
+    tag_ids = dict(Tag.objects.values_list("slug", "id"))
+    CampaignTag.objects.bulk_create(
+        [
+            CampaignTag(campaign_id=campaign_id, tag_id=tag_ids[slug])
+            for campaign_id, slugs in wanted.items()
+            for slug in slugs
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0006_campaign_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Display form, as first entered', max_length=64)),
+                ('slug', models.CharField(help_text='Lowercased lookup key', max_length=64, unique=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CampaignTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='campaign_tags', to='campaigns.campaign')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='campaign_tags', to='campaigns.tag')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='campaign',
+            name='tag_index',
+            field=models.ManyToManyField(blank=True, help_text='Normalized tags, kept in sync with `tags` on save', related_name='campaigns', through='campaigns.CampaignTag', to='campaigns.tag'),
+        ),
+        migrations.AddConstraint(
+            model_name='campaigntag',
+            constraint=models.UniqueConstraint(fields=('tag', 'campaign'), name='uniq_campaigntag_tag_campaign'),
+        ),
+        migrations.RunPython(backfill_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0009_campaign_hot_path_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='trending_dirty',
+            field=models.BooleanField(default=True, help_text='New activity since the trending score was last computed'),
+        ),
+        migrations.AddField(
+            model_name='campaign',
+            name='trending_rescore_at',
+            field=models.DateTimeField(blank=True, help_text='When time decay next moves the trending score', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(condition=models.Q(('trending_dirty', True)), fields=['id'], name='campaign_trending_dirty_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['trending_rescore_at'], name='campaign_trending_rescore_idx'),
+        ),
+    ]
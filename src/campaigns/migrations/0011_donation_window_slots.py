@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:39
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0010_campaign_trending_dirty_set'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DonationWindowSlot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slot', models.PositiveSmallIntegerField(help_text='Hour of the bucket modulo the window size')),
+                ('hour', models.IntegerField(help_text='Hours since the Unix epoch this slot currently holds')),
+                ('backers', models.PositiveIntegerField(default=0)),
+                ('amount', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='donation_window', to='campaigns.campaign')),
+            ],
+            options={
+                'indexes': [models.Index(condition=models.Q(('backers__gt', 0)), fields=['hour'], name='donationwindow_live_hour_idx')],
+                'constraints': [models.UniqueConstraint(fields=('campaign', 'slot'), name='uniq_donationwindow_campaign_slot')],
+            },
+        ),
+    ]
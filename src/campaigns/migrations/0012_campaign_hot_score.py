@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:44
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0011_donation_window_slots'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='hot_score',
+            field=models.FloatField(default=0.0, help_text="Time-independent log-space trending score (CAMPAIGN_TRENDING_MODE = 'hot')"),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(fields=['-hot_score', '-id'], name='campaign_hot_keyset_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='campaign',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-hot_score', '-id'], name='campaign_active_hot_idx'),
+        ),
+    ]
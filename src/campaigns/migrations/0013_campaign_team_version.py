@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0012_campaign_hot_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='campaign',
+            name='team_version',
+            field=models.PositiveIntegerField(default=0, help_text='Bumped on every team_members change (detail ETag, see campaigns/signals.py)'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-17 22:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0013_campaign_team_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CampaignReadModel',
+            fields=[
+                ('campaign', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='read_model', serialize=False, to='campaigns.campaign')),
+                ('card', models.TextField(help_text='Search result item, as rendered by CampaignOut')),
+                ('detail', models.TextField(help_text='campaign_detail response body')),
+                ('etag', models.CharField(max_length=64)),
+                ('last_modified', models.DateTimeField()),
+                ('refreshed_at', models.DateTimeField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:12
+
+from django.db import migrations
+
+from campaigns.services import hot_score_expression
+
+
+def backfill_hot_score(apps, schema_editor):
+    # 0012 added hot_score as 0.0 everywhere, and hot mode only rescores dirty rows,
+    # so idle campaigns would never get a score after switching modes
+    Campaign = apps.get_model("campaigns", "Campaign")
+    Campaign.objects.using(schema_editor.connection.alias).update(hot_score=hot_score_expression())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0015_platform_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_hot_score, migrations.RunPython.noop),
+    ]
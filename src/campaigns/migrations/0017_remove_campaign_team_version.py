@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('campaigns', '0016_backfill_hot_score'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='campaign',
+            name='team_version',
+        ),
+    ]
@@ -2,6 +2,7 @@ from django.db import models
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from Core import settings
+from Core.dirtyfields import DirtyFieldsMixin
 
 # Create your models here.
 
@@ -26,7 +27,7 @@ class CampaignEntry(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)  # Timestamp when created
     updated_at = models.DateTimeField(auto_now=True)  # Timestamp when updated
 
-class Campaign(models.Model):
+class Campaign(DirtyFieldsMixin, models.Model):
     """A crowdfunding campaign created by a student or team."""
 
     # --- Core campaign info ---
@@ -43,6 +44,13 @@ class Campaign(models.Model):
         blank=True,
         help_text="Comma-separated list of tags/skills/technologies",
     )
+    tag_index = models.ManyToManyField(
+        "Tag",
+        through="CampaignTag",
+        related_name="campaigns",
+        blank=True,
+        help_text="Normalized tags, kept in sync with `tags` on save",
+    )
 
     # --- Ownership & team ---
     creator = models.ForeignKey(
@@ -110,7 +118,155 @@ class Campaign(models.Model):
 
     # --- Ranking / trending ---
     trending_score = models.FloatField(default=0.0)
+    hot_score = models.FloatField(
+        default=0.0, help_text="Time-independent log-space trending score (CAMPAIGN_TRENDING_MODE = 'hot')"
+    )
     last_activity_at = models.DateTimeField(auto_now=True)
+    trending_dirty = models.BooleanField(
+        default=True, help_text="New activity since the trending score was last computed"
+    )
+    trending_rescore_at = models.DateTimeField(
+        null=True, blank=True, help_text="When time decay next moves the trending score"
+    )
+
+    class Meta:
+        indexes = [
+            # keyset pagination for search sorts (see campaigns/pagination.py)
+            models.Index(fields=["-created_at", "-id"], name="campaign_new_keyset_idx"),
+            models.Index(fields=["-current_amount", "-id"], name="campaign_funded_keyset_idx"),
+            models.Index(fields=["-trending_score", "-id"], name="campaign_trending_keyset_idx"),
+            # spotlight ordering and the stats COUNT(*), both over active campaigns only
+            models.Index(
+                fields=["-trending_score", "-id"],
+                condition=models.Q(is_active=True),
+                name="campaign_active_trending_idx",
+            ),
+            # the same two for the hot-score trending mode
+            models.Index(fields=["-hot_score", "-id"], name="campaign_hot_keyset_idx"),
+            models.Index(
+                fields=["-hot_score", "-id"],
+                condition=models.Q(is_active=True),
+                name="campaign_active_hot_idx",
+            ),
+            # incremental trending recompute: dirty rows and rows due for decay
+            models.Index(fields=["id"], condition=models.Q(trending_dirty=True), name="campaign_trending_dirty_idx"),
+            models.Index(fields=["trending_rescore_at"], name="campaign_trending_rescore_idx"),
+        ]
+
+    def __str__(self):
+        return self.title
+
+    @property
+    def tag_names(self) -> list[str]:
+        """Tag display names in their original order (use with services.tag_prefetch())."""
+        return [ct.tag.name for ct in self.campaign_tags.all()]
+
+
+class Tag(models.Model):
+    """A single normalized tag/skill/technology."""
+
+    name = models.CharField(max_length=64, help_text="Display form, as first entered")
+    slug = models.CharField(max_length=64, unique=True, help_text="Lowercased lookup key")
+
+    def __str__(self):
+        return self.name
+
+
+class CampaignTag(models.Model):
+    """Campaign <-> Tag join row; (tag, campaign) is indexed for tag intersections."""
+
+    campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE, related_name="campaign_tags")
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="campaign_tags")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["tag", "campaign"], name="uniq_campaigntag_tag_campaign"),
+        ]
+
+    def __str__(self):
+        return f"{self.campaign_id}:{self.tag_id}"
+
+
+class DonationWindowSlot(models.Model):
+    """
+    One hourly bucket of a campaign's 24-slot donation ring, which maintains
+    Campaign.backer_count_24h / donation_sum_24h (see campaigns/windows.py).
+    """
+
+    campaign = models.ForeignKey(Campaign, on_delete=models.CASCADE, related_name="donation_window")
+    slot = models.PositiveSmallIntegerField(help_text="Hour of the bucket modulo the window size")
+    hour = models.IntegerField(help_text="Hours since the Unix epoch this slot currently holds")
+    backers = models.PositiveIntegerField(default=0)
+    amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["campaign", "slot"], name="uniq_donationwindow_campaign_slot"),
+        ]
+        indexes = [
+            # only non-empty buckets ever need rolling off
+            models.Index(fields=["hour"], condition=models.Q(backers__gt=0), name="donationwindow_live_hour_idx"),
+        ]
 
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return f"{self.campaign_id}@{self.hour}"
+
+
+class CampaignReadModel(models.Model):
+    """
+    Pre-serialized JSON for the read endpoints, regenerated on every write
+    (see campaigns/readmodel.py).
+    """
+
+    campaign = models.OneToOneField(
+        Campaign, on_delete=models.CASCADE, primary_key=True, related_name="read_model"
+    )
+    card = models.TextField(help_text="Search result item, as rendered by CampaignOut")
+    detail = models.TextField(help_text="campaign_detail response body")
+    etag = models.CharField(max_length=64)
+    last_modified = models.DateTimeField()
+    refreshed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"read model for {self.campaign_id}"
+
+
+class PlatformCounters(models.Model):
+    """
+    Single row (pk=1) of platform-wide totals behind /campaigns/stats, kept
+    up to date by signals in the same transaction as the writes they count
+    (see campaigns/counters.py).
+    """
+
+    active_projects = models.IntegerField(default=0)
+    active_creators = models.IntegerField(default=0)
+    funds_raised = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "platform counters"
+
+    def __str__(self):
+        return f"{self.active_projects} projects, {self.active_creators} creators, {self.funds_raised} raised"
+
+
+class CampaignSearchDocument(models.Model):
+    """
+    Read-only view of the SQLite FTS5 index over Campaign (see campaigns/search.py).
+    The table and its sync triggers are created by migration 0006; on Postgres the
+    index lives in the `search_vector` column instead and this model is unused.
+    """
+
+    campaign = models.OneToOneField(
+        Campaign,
+        on_delete=models.DO_NOTHING,
+        primary_key=True,
+        db_column="rowid",
+        related_name="search_document",
+    )
+    # FTS5 exposes a hidden column named after the table; MATCH and bm25() take it
+    document = models.TextField(db_column="campaigns_campaign_fts")
+
+    class Meta:
+        managed = False
+        db_table = "campaigns_campaign_fts"
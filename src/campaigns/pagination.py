@@ -0,0 +1,75 @@
+# campaigns/pagination.py
+import base64
+import binascii
+import json
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db.models import Q
+from ninja.errors import HttpError
+
+# Which score orders "trending" (spotlight, sort=trending, leaderboard, suggest):
+#   "decay": trending_score, decays with time so idle rows are rewritten hourly
+#   "hot":   hot_score, time-independent; only rows with new activity are rewritten
+TRENDING_MODE = getattr(settings, "CAMPAIGN_TRENDING_MODE", "decay")
+TRENDING_COLUMN = "hot_score" if TRENDING_MODE == "hot" else "trending_score"
+
+# sort name -> (column, parser for the cursor value). Each pair is served by a
+# composite (column DESC, id DESC) index declared on Campaign.Meta.
+KEYSET_SORTS = {
+    "new": ("created_at", datetime.fromisoformat),
+    "funded": ("current_amount", Decimal),
+    "trending": (TRENDING_COLUMN, float),
+}
+
+
+def keyset_ordering(sort: str) -> tuple[str, str]:
+    column, _ = KEYSET_SORTS[sort]
+    return (f"-{column}", "-id")
+
+
+def encode_cursor(sort: str, value, pk: int) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Decimal):
+        value = str(value)
+    raw = json.dumps([sort, value, pk], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, sort: str):
+    """Return (sort value, id) for `cursor`, or raise a 400 if it's malformed or for another sort."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort, value, pk = json.loads(base64.urlsafe_b64decode(padded))
+        if cursor_sort != sort:
+            raise ValueError(cursor_sort)
+        _, parse = KEYSET_SORTS[sort]
+        return parse(value), int(pk)
+    except (binascii.Error, InvalidOperation, TypeError, ValueError):
+        raise HttpError(400, "Invalid cursor")
+
+
+def keyset_page(qs, sort: str, cursor: str, page_size: int):
+    """
+    One page of `qs` in (sort column DESC, id DESC) order starting after `cursor`
+    ("" for the first page). Costs a single index range scan regardless of depth;
+    returns (objects, next_cursor) with next_cursor None on the last page.
+    """
+    if sort not in KEYSET_SORTS:
+        raise HttpError(400, f"Cursor pagination supports sort={', '.join(KEYSET_SORTS)}")
+    column, _ = KEYSET_SORTS[sort]
+
+    qs = qs.order_by(*keyset_ordering(sort))
+    if cursor:
+        value, pk = decode_cursor(cursor, sort)
+        qs = qs.filter(Q(**{f"{column}__lt": value}) | Q(**{column: value, "id__lt": pk}))
+
+    # one extra row tells us whether there is a next page without a COUNT(*)
+    rows = list(qs[: page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, encode_cursor(sort, getattr(last, column), last.pk)
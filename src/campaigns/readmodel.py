@@ -0,0 +1,177 @@
+# campaigns/readmodel.py
+"""
+Denormalized read model: each campaign's search card and detail body stored
+as ready-to-send JSON in CampaignReadModel, regenerated whenever the campaign,
+its team or a team member's name changes (campaigns/signals.py). Read
+endpoints splice these strings into responses instead of loading and
+serializing models; a missing row is built on first read.
+"""
+import hashlib
+import json
+import logging
+
+from django.db.models import Q
+from django.utils import timezone
+from ninja.responses import NinjaJSONEncoder
+
+from .models import Campaign, CampaignReadModel
+from .schemas import CampaignOut
+from .services import tag_prefetch
+
+logger = logging.getLogger(__name__)
+
+DETAIL_IMAGES = [
+    "https://images.unsplash.com/photo-1534796636912-3b95b3ab5986?q=80&w=1600&auto=format&fit=crop",
+    "https://images.unsplash.com/photo-1542831371-29b0f74f9713?q=80&w=1600&auto=format&fit=crop",
+    "https://images.unsplash.com/photo-1542831371-d531d36971e6?q=80&w=1600&auto=format&fit=crop",
+]
+
+
+def detail_queryset():
+    # creator, tags and team in three queries however many campaigns are loaded
+    return Campaign.objects.select_related("creator").prefetch_related(tag_prefetch(), "team_members")
+
+
+def card_payload(c) -> dict:
+    return {
+        "id": c.id,
+        "title": c.title,
+        "description": c.description,
+        "school": c.school,
+        "current_amount": c.current_amount,
+        "goal_amount": c.goal_amount,
+        "tags": c.tag_names,
+        "cover_image": getattr(c, "cover_image", None),
+        "backers": getattr(c, "backers", 0),
+    }
+
+
+def card_json(payload: dict) -> str:
+    """A search item exactly as the CampaignOut schema renders it."""
+    # CampaignOut declares whole-unit amounts, and pydantic rejects a Decimal with cents
+    amounts = {f: int(payload[f]) for f in ("current_amount", "goal_amount")}
+    return CampaignOut.model_validate({**payload, **amounts}).model_dump_json()
+
+
+def detail_payload(c) -> dict:
+    return {
+        "id": c.id,
+        "title": c.title,
+        "school": c.school,
+        "description": c.description,
+        "goal_amount": float(c.goal_amount),
+        "current_amount": float(c.current_amount),
+        "tags": c.tag_names,
+        "images": DETAIL_IMAGES,
+        "creator": {
+            "id": c.creator.id,
+            "name": getattr(c.creator, "username", str(c.creator)),
+        },
+        "team_members": [
+            {"id": u.id, "name": getattr(u, "username", str(u))}
+            for u in c.team_members.all()
+        ],
+        "is_sponsored": bool(c.sponsored_by),
+        "sponsored_by": c.sponsored_by,
+        "start_date": str(c.start_date),
+        "end_date": str(c.end_date) if c.end_date else None,
+        "milestones": c.milestones if c.milestones is not None else [],
+        "verified": True,
+    }
+
+
+def detail_etag(campaign_id, detail: str) -> str:
+    # a hash of the body itself, so anything shown in it (e.g. a renamed team member) changes it
+    return f'W/"{campaign_id}-{hashlib.blake2b(detail.encode(), digest_size=8).hexdigest()}"'
+
+
+def build_read_model(c) -> CampaignReadModel:
+    detail = json.dumps(detail_payload(c), cls=NinjaJSONEncoder)
+    return CampaignReadModel(
+        campaign=c,
+        card=card_json(card_payload(c)),
+        detail=detail,
+        etag=detail_etag(c.id, detail),
+        last_modified=c.updated_at,
+        refreshed_at=timezone.now(),
+    )
+
+
+def refresh_read_models(campaign_ids) -> dict[int, CampaignReadModel]:
+    """Rebuild the rows for `campaign_ids` (ids that no longer exist are skipped)."""
+    rows = [build_read_model(c) for c in detail_queryset().filter(id__in=list(campaign_ids))]
+    previous = {
+        campaign_id: (etag, last_modified)
+        for campaign_id, etag, last_modified in CampaignReadModel.objects.filter(
+            campaign_id__in=[row.campaign_id for row in rows]
+        ).values_list("campaign_id", "etag", "last_modified")
+    }
+    for row in rows:
+        etag, last_modified = previous.get(row.campaign_id, (None, None))
+        if etag == row.etag:
+            row.last_modified = last_modified  # same body, same validators
+        elif etag is not None:
+            # the body changed, possibly without the campaign row (a team member's rename)
+            row.last_modified = row.refreshed_at
+    CampaignReadModel.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["campaign"],
+        update_fields=["card", "detail", "etag", "last_modified", "refreshed_at"],
+    )
+    return {row.campaign_id: row for row in rows}
+
+
+def refresh_or_drop_read_models(campaign_ids) -> list[int]:
+    """
+    refresh_read_models() for the signal handlers, which run after the write has
+    committed: if the rebuild fails, the rows are deleted instead, so the next
+    read rebuilds them rather than serving stale JSON. Returns the ids.
+    """
+    campaign_ids = list(campaign_ids)
+    try:
+        refresh_read_models(campaign_ids)
+    except Exception:
+        logger.exception("read model refresh failed, dropping rows for campaigns %s", campaign_ids)
+        CampaignReadModel.objects.filter(campaign_id__in=campaign_ids).delete()
+    return campaign_ids
+
+
+def user_campaign_ids(user_id) -> list[int]:
+    """Every campaign that shows this user (as creator or team member)."""
+    return list(
+        Campaign.objects.filter(Q(creator_id=user_id) | Q(team_members=user_id))
+        .values_list("id", flat=True)
+        .distinct()
+    )
+
+
+def get_read_models(campaign_ids, fields=("card",)) -> dict[int, CampaignReadModel]:
+    """Rows for `campaign_ids`, building any that are missing."""
+    rows = {
+        row.campaign_id: row
+        for row in CampaignReadModel.objects.filter(campaign_id__in=campaign_ids).only("campaign", *fields)
+    }
+    missing = [i for i in campaign_ids if i not in rows]
+    if missing:
+        rows.update(refresh_read_models(missing))
+    return rows
+
+
+def get_cards(campaign_ids) -> list[str]:
+    """Card JSON for each id, in order; unknown ids are skipped."""
+    rows = get_read_models(campaign_ids)
+    return [rows[i].card for i in campaign_ids if i in rows]
+
+
+def detail_entries(campaign_ids) -> dict[int, dict]:
+    """campaign id -> {"etag", "last_modified", "body"} as cached for campaign_detail."""
+    rows = get_read_models(campaign_ids, fields=("detail", "etag", "last_modified"))
+    return {
+        i: {
+            "etag": row.etag,
+            "last_modified": int(row.last_modified.timestamp()),
+            "body": row.detail.encode(),
+        }
+        for i, row in rows.items()
+    }
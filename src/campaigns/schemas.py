@@ -1,7 +1,7 @@
 from datetime import datetime
 from decimal import Decimal
 from ninja import Schema
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 # Schema for creating a new campaign entry (user is taken from request.user)
 class CampaignEntryCreateSchema(Schema):
@@ -78,8 +78,27 @@ class CampaignOut(Schema):
     cover_image: Optional[str]    
     backers: int                
 
+class FacetCount(Schema):
+    value: str
+    count: int
+
 class SearchResponse(Schema):
     items: List[CampaignOut]
-    total: int
-    page: int
-    page_size: int
\ No newline at end of file
+    total: Optional[int] = None  # not computed in cursor mode
+    total_exact: bool = True  # False when total is an estimate or a cached count
+    page: Optional[int] = None  # not used in cursor mode
+    page_size: int
+    next_cursor: Optional[str] = None
+    facets: Optional[Dict[str, List[FacetCount]]] = None
+
+class Suggestion(Schema):
+    text: str
+    kind: str  # "campaign", "tag" or "school"
+    campaign_id: Optional[int] = None
+
+class SuggestResponse(Schema):
+    items: List[Suggestion]
+
+class EngagementIn(Schema):
+    event: str  # "view", "like", "comment" or "save"
+    count: int = 1
@@ -0,0 +1,158 @@
+# campaigns/search.py
+import re
+from abc import ABC, abstractmethod
+
+from django.db import connection, connections
+from django.db.models import BooleanField, F, FloatField, Func, Lookup, Q, Value
+from django.db.models.expressions import RawSQL
+
+from .fts import FTS_TRIGGERS, REBUILD_FTS
+from .models import Campaign, CampaignSearchDocument
+from .services import split_tags, tag_slug
+
+TS_CONFIG = "english"
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+def tokenize(q: str) -> list[str]:
+    """Lowercased word tokens of a free-text query, punctuation dropped."""
+    return _TOKEN_RE.findall((q or "").lower())
+
+
+def normalize_filters(q="", tags=None, school=None, min_goal=None, max_goal=None) -> dict:
+    """
+    Canonical form of the search filters: queries that can only ever return the
+    same rows map to the same dict (used for count and result cache keys).
+    """
+    return {
+        "q": " ".join(tokenize(q)),
+        "tags": sorted({tag_slug(t) for t in split_tags(tags)}),
+        "school": (school or "").strip().lower(),
+        "min_goal": min_goal,
+        "max_goal": max_goal,
+    }
+
+
+class FullTextMatch(Lookup):
+    """`<fts table> MATCH <query>` for SQLite FTS5."""
+
+    lookup_name = "match"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", lhs_params + rhs_params
+
+
+# registered on the field instance only, so plain TextFields don't grow a __match lookup
+CampaignSearchDocument._meta.get_field("document").register_lookup(FullTextMatch)
+
+
+class SearchBackend(ABC):
+    """
+    Filters a Campaign queryset down to the rows matching a free-text query and
+    annotates them with `search_rank` (higher is more relevant). In the
+    full-text backends query words match whole tokens only ("java" doesn't find
+    "javascript"; /suggest covers prefixes). A query with no word tokens
+    matches everything.
+    """
+
+    @abstractmethod
+    def search(self, qs, q: str):
+        ...
+
+
+class SQLiteFTS5Backend(SearchBackend):
+    """
+    External-content FTS5 table kept in sync by triggers (see migration 0006).
+    Ranked with bm25(), weighting title > tags > school > description.
+    """
+
+    weights = (10.0, 1.0, 2.0, 5.0)  # title, description, school, tags
+
+    def search(self, qs, q):
+        tokens = tokenize(q)
+        if not tokens:
+            return qs.annotate(search_rank=Value(0.0, output_field=FloatField()))
+        # every token must match as a whole token
+        match = " ".join(f'"{t}"' for t in tokens)
+        bm25 = Func(
+            F("search_document__document"),
+            *[Value(w) for w in self.weights],
+            function="bm25",
+            output_field=FloatField(),
+        )
+        return (
+            qs.filter(search_document__document__match=match)
+            # bm25() is "lower is better"; flip it so both backends sort the same way
+            .annotate(search_rank=bm25 * Value(-1.0))
+        )
+
+
+class PostgresFullTextBackend(SearchBackend):
+    """
+    Generated, weighted `search_vector` tsvector column with a GIN index
+    (see migration 0006). Ranked with ts_rank().
+    """
+
+    def search(self, qs, q):
+        tokens = tokenize(q)
+        if not tokens:
+            return qs.annotate(search_rank=Value(0.0, output_field=FloatField()))
+        tsquery = " & ".join(tokens)
+        column = f'"{Campaign._meta.db_table}"."search_vector"'
+        to_tsquery = f"to_tsquery('{TS_CONFIG}', %s)"
+        return qs.filter(
+            RawSQL(f"{column} @@ {to_tsquery}", (tsquery,), output_field=BooleanField())
+        ).annotate(
+            search_rank=RawSQL(f"ts_rank({column}, {to_tsquery})", (tsquery,), output_field=FloatField())
+        )
+
+
+class SubstringBackend(SearchBackend):
+    """Unindexed substring fallback for databases without a full-text backend."""
+
+    def search(self, qs, q):
+        return qs.filter(
+            Q(title__icontains=q)
+            | Q(description__icontains=q)
+            | Q(school__icontains=q)
+            | Q(tags__icontains=q)
+        ).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+_BACKENDS = {
+    "sqlite": SQLiteFTS5Backend,
+    "postgresql": PostgresFullTextBackend,
+}
+
+
+def get_search_backend() -> SearchBackend:
+    return _BACKENDS.get(connection.vendor, SubstringBackend)()
+
+
+def ensure_fts_triggers(using="default", **kwargs):
+    """
+    post_migrate hook: restore missing FTS5 sync triggers and reindex if any were
+    lost. SQLite implements most ALTERs by rebuilding the table, which silently
+    drops them.
+    """
+    conn = connections[using]
+    if conn.vendor != "sqlite":
+        return
+    table = CampaignSearchDocument._meta.db_table
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type IN ('table', 'trigger') AND name LIKE %s",
+            [f"{table}%"],
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        if table not in existing:
+            return  # migration 0006 not applied yet
+        missing = [name for name in FTS_TRIGGERS if name not in existing]
+        if not missing:
+            return
+        for name in missing:
+            cursor.execute(FTS_TRIGGERS[name])
+        # writes made while the triggers were gone never reached the index
+        cursor.execute(REBUILD_FTS)
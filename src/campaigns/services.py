@@ -1,26 +1,216 @@
 # campaigns/services.py
+import logging
+import time
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.core.cache import cache
+from django.db.models import Count, DateTimeField, FloatField, Func, Prefetch, Q, Value
+from django.db.models.functions import Cast, Greatest, Log
 from django.utils import timezone
-from .models import Campaign
+from .leaderboard import publish_trending_leaderboard
+from .pagination import TRENDING_MODE
+from .models import Campaign, CampaignTag, Tag
 
-def recompute_trending_scores():
-    now = timezone.now()
-    qs = Campaign.objects.filter(is_active=True).only(
-        "id", "last_activity_at", "like_count", "view_count",
-        "comment_count", "donation_sum_24h", "recruiter_saves", "backer_count_24h"
+logger = logging.getLogger(__name__)
+
+
+def split_tags(value: str | None) -> list[str]:
+    """Comma-separated tags -> list of stripped, non-empty names."""
+    if not value:
+        return []
+    return [t.strip() for t in value.split(",") if t.strip()]
+
+
+def tag_slug(name: str) -> str:
+    return name.strip().lower()[:64]
+
+
+def tag_prefetch():
+    """Prefetch for Campaign.tag_names: one extra query for a whole page of campaigns."""
+    return Prefetch(
+        "campaign_tags",
+        queryset=CampaignTag.objects.select_related("tag").order_by("id"),
+    )
+
+
+def filter_by_tags(qs, names):
+    """Campaigns carrying *all* of the given tags (exact, case-insensitive)."""
+    slugs = {tag_slug(n) for n in names}
+    if not slugs:
+        return qs
+    matching = (
+        CampaignTag.objects.filter(tag__slug__in=slugs)
+        .values("campaign_id")
+        .annotate(n=Count("tag_id"))
+        .filter(n=len(slugs))
+        .values("campaign_id")
+    )
+    return qs.filter(id__in=matching)
+
+
+def sync_campaign_tags(campaign):
+    """Bring the Tag/CampaignTag rows for `campaign` in line with its `tags` CSV."""
+    wanted = {}
+    for name in split_tags(campaign.tags):
+        wanted.setdefault(tag_slug(name), name[:64])
+
+    current = dict(
+        CampaignTag.objects.filter(campaign=campaign).values_list("tag__slug", "id")
+    )
+
+    stale = [pk for slug, pk in current.items() if slug not in wanted]
+    if stale:
+        CampaignTag.objects.filter(pk__in=stale).delete()
+
+    missing = [slug for slug in wanted if slug not in current]
+    if missing:
+        Tag.objects.bulk_create(
+            [Tag(slug=slug, name=wanted[slug]) for slug in missing], ignore_conflicts=True
+        )
+        tag_ids = dict(Tag.objects.filter(slug__in=missing).values_list("slug", "id"))
+        CampaignTag.objects.bulk_create(
+            [CampaignTag(campaign=campaign, tag_id=tag_ids[slug]) for slug in missing],
+            ignore_conflicts=True,
+        )
+
+
+def add_campaign_tags(campaigns):
+    """sync_campaign_tags for many new campaigns (no tag rows yet) in three queries."""
+    wanted = {}
+    for campaign in campaigns:
+        for name in split_tags(campaign.tags):
+            wanted.setdefault(tag_slug(name), name[:64])
+    if not wanted:
+        return
+    Tag.objects.bulk_create([Tag(slug=slug, name=name) for slug, name in wanted.items()], ignore_conflicts=True)
+    tag_ids = dict(Tag.objects.filter(slug__in=wanted).values_list("slug", "id"))
+    CampaignTag.objects.bulk_create(
+        [
+            CampaignTag(campaign_id=campaign.pk, tag_id=tag_ids[slug])
+            for campaign in campaigns
+            for slug in dict.fromkeys(tag_slug(name) for name in split_tags(campaign.tags))
+        ],
+        ignore_conflicts=True,
     )
 
-    for c in qs:
-        hours = max(1.0, (now - c.last_activity_at).total_seconds() / 3600.0)
-
-        score = (
-            3  * (c.like_count or 0) +
-            1  * (c.view_count or 0) +
-            6  * (c.comment_count or 0) +
-            8  * float(c.donation_sum_24h or 0) +
-            10 * (c.recruiter_saves or 0) +
-            12 * (c.backer_count_24h or 0)
-        ) / (1 + 0.15 * hours)
-
-        # Optional: clamp to avoid extremes
-        c.trending_score = max(0.0, float(score))
-        c.save(update_fields=["trending_score"])
+# activity signal -> weight in the trending score
+TRENDING_WEIGHTS = {
+    "like_count": 3,
+    "view_count": 1,
+    "comment_count": 6,
+    "donation_sum_24h": 8,
+    "recruiter_saves": 10,
+    "backer_count_24h": 12,
+}
+TRENDING_DECAY_PER_HOUR = 0.15
+# Idle campaigns are rescored once per bucket as their score decays.
+TRENDING_DECAY_BUCKET = timedelta(hours=1)
+# Hot mode: hours of recency worth a 10x difference in activity.
+HOT_SCORE_HOURS_PER_DECADE = 12.0
+HOT_SCORE_EPOCH = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+# Last recompute's metrics: {"at", "mode", "full", "rows", "leaderboard", "seconds"}
+TRENDING_STATS_KEY = "campaigns:trending:last_run"
+
+
+class HoursSince(Func):
+    """Fractional hours from a datetime expression until `now`, computed in the database."""
+
+    output_field = FloatField()
+
+    def __init__(self, expression, now):
+        super().__init__(expression, Value(now, output_field=DateTimeField()))
+
+    def _compile(self, compiler):
+        (then_sql, then_params), (now_sql, now_params) = (
+            compiler.compile(e) for e in self.get_source_expressions()
+        )
+        return then_sql, then_params, now_sql, now_params
+
+    def as_sql(self, compiler, connection, **extra):
+        then_sql, then_params, now_sql, now_params = self._compile(compiler)
+        return f"(EXTRACT(EPOCH FROM ({now_sql} - {then_sql})) / 3600.0)", (*now_params, *then_params)
+
+    def as_sqlite(self, compiler, connection, **extra):
+        then_sql, then_params, now_sql, now_params = self._compile(compiler)
+        return f"((julianday({now_sql}) - julianday({then_sql})) * 24.0)", (*now_params, *then_params)
+
+
+def _activity_expression():
+    return sum(
+        Value(float(weight)) * Cast(field, FloatField())
+        for field, weight in TRENDING_WEIGHTS.items()
+    )
+
+
+def trending_score_expression(now):
+    """
+    SQL expression for
+        max(0, sum(weight * signal) / (1 + 0.15 * max(1, hours since last activity)))
+    so the whole table can be rescored by a single UPDATE.
+    """
+    activity = _activity_expression()
+    hours = Greatest(HoursSince("last_activity_at", now), Value(1.0))
+    return Greatest(activity / (Value(1.0) + Value(TRENDING_DECAY_PER_HOUR) * hours), Value(0.0))
+
+
+def hot_score_expression():
+    """
+    SQL expression for the hot-mode score (Reddit "hot" style)
+        log10(max(1, sum(weight * signal))) + hours from HOT_SCORE_EPOCH to last activity / 12
+    Recency is added instead of decay being divided out, so a row's score does
+    not change with the clock and ordering on it stays correct until its next activity.
+    """
+    activity = Greatest(_activity_expression(), Value(1.0))
+    # HoursSince(x, epoch) is epoch - x, i.e. minus the hours since the epoch
+    hours = HoursSince("last_activity_at", HOT_SCORE_EPOCH) * Value(-1.0)
+    return Log(Value(10.0), activity) + hours / Value(HOT_SCORE_HOURS_PER_DECADE)
+
+
+def recompute_trending_scores(full: bool = False) -> int:
+    """
+    Rescore active campaigns in one set-based UPDATE and return the rows touched,
+    then publish the top-K leaderboard (campaigns/leaderboard.py) from the new scores.
+
+    In "decay" mode (CAMPAIGN_TRENDING_MODE) only campaigns that are dirty (new
+    activity) or whose decay bucket has rolled over (trending_rescore_at passed)
+    are rescored, so idle campaigns are rewritten at most once per
+    TRENDING_DECAY_BUCKET. In "hot" mode hot_score doesn't depend on the clock,
+    so only dirty campaigns are rescored. Decay mode refreshes hot_score on the
+    rows it touches too, so it is current whenever the mode is switched. `full`
+    rescores all.
+    """
+    now = timezone.now()
+    started = time.perf_counter()
+    qs = Campaign.objects.filter(is_active=True)
+    if TRENDING_MODE == "hot":
+        if not full:
+            qs = qs.filter(trending_dirty=True)
+        touched = qs.update(hot_score=hot_score_expression(), trending_dirty=False)
+    else:
+        if not full:
+            qs = qs.filter(
+                Q(trending_dirty=True)
+                | Q(trending_rescore_at__lte=now)
+                | Q(trending_rescore_at__isnull=True)
+            )
+        touched = qs.update(
+            trending_score=trending_score_expression(now),
+            # kept current here too, so switching to hot mode needs no full rescore
+            hot_score=hot_score_expression(),
+            trending_dirty=False,
+            trending_rescore_at=now + TRENDING_DECAY_BUCKET,
+        )
+    leaderboard = publish_trending_leaderboard()
+
+    stats = {
+        "at": now.isoformat(),
+        "mode": TRENDING_MODE,
+        "full": full,
+        "rows": touched,
+        "leaderboard": len(leaderboard["entries"]),
+        "seconds": round(time.perf_counter() - started, 4),
+    }
+    cache.set(TRENDING_STATS_KEY, stats, None)
+    logger.info("trending recompute touched %(rows)d rows in %(seconds).3fs (full=%(full)s)", stats)
+    return touched
@@ -0,0 +1,83 @@
+# campaigns/signals.py
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_search_version, invalidate_detail
+from .counters import activation_delta, adjust_platform_counters
+from .models import Campaign
+from .readmodel import refresh_or_drop_read_models, user_campaign_ids
+from .services import sync_campaign_tags
+from .suggest import suggest_index
+
+
+@receiver(post_save, sender=Campaign)
+def campaign_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created or update_fields is None or "tags" in update_fields:
+        sync_campaign_tags(instance)
+    adjust_platform_counters(active_projects=activation_delta(instance, created, update_fields))
+    campaign_id = instance.pk
+    # after commit, so a concurrent reader can't re-cache the old rows under the new version;
+    # robust: the write has already committed, so a failure mustn't skip the hooks after it
+    transaction.on_commit(lambda: refresh_or_drop_read_models([campaign_id]), robust=True)
+    transaction.on_commit(bump_search_version)
+    transaction.on_commit(lambda: invalidate_detail(campaign_id))
+    transaction.on_commit(lambda: suggest_index.upsert(instance))
+
+
+@receiver(post_delete, sender=Campaign)
+def campaign_deleted(sender, instance, **kwargs):
+    if instance.loaded_value("is_active", instance.is_active):
+        adjust_platform_counters(active_projects=-1)
+    campaign_id = instance.pk
+    transaction.on_commit(bump_search_version)
+    transaction.on_commit(lambda: invalidate_detail(campaign_id))
+    transaction.on_commit(lambda: suggest_index.remove(campaign_id))
+
+
+@receiver(m2m_changed, sender=Campaign.team_members.through)
+def campaign_team_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear" and reverse:
+        # user.campaign_teams.clear(): pk_set is None afterwards, so note the campaigns now
+        instance._cleared_campaign_ids = list(instance.campaign_teams.values_list("id", flat=True))
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        campaign_ids = [instance.pk]
+    elif action == "post_clear":
+        campaign_ids = instance.__dict__.pop("_cleared_campaign_ids", [])
+    else:
+        campaign_ids = pk_set
+    if not campaign_ids:
+        return
+
+    transaction.on_commit(lambda: refresh_or_drop_read_models(campaign_ids), robust=True)
+    for campaign_id in campaign_ids:
+        transaction.on_commit(lambda campaign_id=campaign_id: invalidate_detail(campaign_id))
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def user_counted(sender, instance, created, update_fields=None, **kwargs):
+    adjust_platform_counters(active_creators=activation_delta(instance, created, update_fields))
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def user_uncounted(sender, instance, **kwargs):
+    if instance.loaded_value("is_active", instance.is_active):
+        adjust_platform_counters(active_creators=-1)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def campaign_user_saved(sender, instance, created, update_fields=None, **kwargs):
+    # usernames are baked into the detail bodies of the campaigns a user is on
+    if created or (update_fields is not None and "username" not in update_fields):
+        return
+    user_id = instance.pk
+
+    def refresh():
+        for campaign_id in refresh_or_drop_read_models(user_campaign_ids(user_id)):
+            invalidate_detail(campaign_id)
+
+    transaction.on_commit(refresh, robust=True)
@@ -0,0 +1,172 @@
+# campaigns/suggest.py
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from .models import Campaign, CampaignTag
+from .pagination import TRENDING_COLUMN
+
+# Full rebuild interval; picks up changes made by other processes and bulk
+# trending recomputes, which don't fire signals.
+REBUILD_SECONDS = getattr(settings, "CAMPAIGN_SUGGEST_REBUILD_SECONDS", 300)
+# Upper bound on index entries scanned per lookup, keeps short prefixes cheap.
+MAX_SCAN = 2000
+
+
+def _norm(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def _suffixes(text: str):
+    """'Robot Arm Kit' -> 'robot arm kit', 'arm kit', 'kit' so any word can start a match."""
+    words = _norm(text).split()
+    for i in range(len(words)):
+        yield " ".join(words[i:])
+
+
+def _entries(campaign_id, title, school, tag_names):
+    entries = set()
+    for key in _suffixes(title):
+        entries.add((key, campaign_id, "campaign", title))
+    for name in tag_names:
+        for key in _suffixes(name):
+            entries.add((key, campaign_id, "tag", name))
+    if school:
+        for key in _suffixes(school):
+            entries.add((key, campaign_id, "school", school))
+    return entries
+
+
+class PrefixIndex:
+    """
+    In-process sorted array of (key, campaign id, kind, text) over active campaign
+    titles, tags and schools. Lookups are a bisect plus a bounded scan; nothing
+    touches the database except the periodic background rebuild.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._keys = []
+        self._by_campaign = {}
+        self._scores = {}
+        self._built_at = None
+        self._rebuilding = False
+
+    # --- building ---
+
+    def build(self):
+        tags = {}
+        for campaign_id, name in (
+            CampaignTag.objects.filter(campaign__is_active=True)
+            .order_by("id")
+            .values_list("campaign_id", "tag__name")
+            .iterator()
+        ):
+            tags.setdefault(campaign_id, []).append(name)
+
+        keys, by_campaign, scores = [], {}, {}
+        rows = (
+            Campaign.objects.filter(is_active=True)
+            .values_list("id", "title", "school", TRENDING_COLUMN)
+            .iterator()
+        )
+        for campaign_id, title, school, score in rows:
+            entries = _entries(campaign_id, title, school, tags.get(campaign_id, []))
+            by_campaign[campaign_id] = entries
+            scores[campaign_id] = score
+            keys.extend(entries)
+        keys.sort()
+
+        with self._lock:
+            self._keys, self._by_campaign, self._scores = keys, by_campaign, scores
+            self._built_at = time.monotonic()
+
+    def _rebuild_in_background(self):
+        try:
+            self.build()
+        finally:
+            with self._lock:
+                self._rebuilding = False
+            close_old_connections()
+
+    def ensure_fresh(self):
+        if self._built_at is None:
+            self.build()
+            return
+        with self._lock:
+            if self._rebuilding or time.monotonic() - self._built_at <= REBUILD_SECONDS:
+                return
+            self._rebuilding = True
+        # keep serving the current index while the new one is built
+        threading.Thread(target=self._rebuild_in_background, daemon=True).start()
+
+    # --- incremental maintenance (signals) ---
+
+    def _discard(self, campaign_id):
+        for entry in self._by_campaign.pop(campaign_id, ()):
+            i = bisect_left(self._keys, entry)
+            if i < len(self._keys) and self._keys[i] == entry:
+                del self._keys[i]
+        self._scores.pop(campaign_id, None)
+
+    def upsert(self, campaign):
+        if self._built_at is None:
+            return  # built lazily on first lookup
+        tag_names = []
+        if campaign.is_active:
+            # the normalized Tag names, as build() indexes them, not the raw tags text
+            tag_names = list(
+                CampaignTag.objects.filter(campaign_id=campaign.pk)
+                .order_by("id")
+                .values_list("tag__name", flat=True)
+            )
+        with self._lock:
+            self._discard(campaign.pk)
+            if not campaign.is_active:
+                return
+            entries = _entries(campaign.pk, campaign.title, campaign.school, tag_names)
+            for entry in entries:
+                insort(self._keys, entry)
+            self._by_campaign[campaign.pk] = entries
+            self._scores[campaign.pk] = getattr(campaign, TRENDING_COLUMN)
+
+    def remove(self, campaign_id):
+        if self._built_at is None:
+            return
+        with self._lock:
+            self._discard(campaign_id)
+
+    # --- lookup ---
+
+    def suggest(self, prefix: str, limit: int = 8) -> list[dict]:
+        prefix = _norm(prefix)
+        if not prefix:
+            return []
+        self.ensure_fresh()
+
+        best = {}  # (kind, text or campaign id) -> suggestion
+        with self._lock:
+            keys, scores = self._keys, self._scores
+            i = bisect_left(keys, (prefix,))
+            end = min(len(keys), i + MAX_SCAN)
+            while i < end and keys[i][0].startswith(prefix):
+                _, campaign_id, kind, text = keys[i]
+                i += 1
+                score = scores.get(campaign_id, 0.0)
+                ident = campaign_id if kind == "campaign" else text.lower()
+                current = best.get((kind, ident))
+                if current is None or score > current[0]:
+                    best[(kind, ident)] = (score, kind, text, campaign_id)
+
+        top = heapq.nlargest(limit, best.values(), key=lambda s: s[0])
+        return [
+            {"text": text, "kind": kind, "campaign_id": campaign_id if kind == "campaign" else None}
+            for _, kind, text, campaign_id in top
+        ]
+
+
+suggest_index = PrefixIndex()
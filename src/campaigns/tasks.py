@@ -1,7 +1,13 @@
 # campaigns/tasks.py
 from celery import shared_task
 from .services import recompute_trending_scores
+from .windows import expire_donation_windows
 
 @shared_task
-def recompute_trending_scores_task():
-    recompute_trending_scores()
+def recompute_trending_scores_task(full=False):
+    return recompute_trending_scores(full=full)
+
+
+@shared_task
+def expire_donation_windows_task():
+    return expire_donation_windows()
@@ -1,3 +1,839 @@
-from django.test import TestCase
+import importlib
+import io
+import json
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.apps import apps as django_apps
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError, connection
+from django.db.models.query import QuerySet
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from ninja.errors import HttpError
+from ninja_jwt.tokens import RefreshToken
+
+from accounts.auth import local_users
+from accounts.management.commands.import_users import FIELDS as USER_FIELDS
+from payments.models import Transaction
+
+from .cache import detail_cache_key, get_search_version
+from .counters import rebuild_platform_counters
+from .counting import count_results
+from .engagement import EngagementBuffer
+from .facets import compute_facets
+from .management.commands.export_campaigns import campaign_row
+from .models import Campaign, CampaignReadModel
+from .pagination import decode_cursor, encode_cursor
+from .readmodel import get_cards
+from .search import ensure_fts_triggers
+from .services import TRENDING_DECAY_BUCKET, add_campaign_tags, recompute_trending_scores, sync_campaign_tags
+from .suggest import PrefixIndex
+from .windows import expire_donation_windows, record_donation
+
+CAMPAIGN_TABLE = Campaign._meta.db_table
+
+
+@skipUnless(connection.vendor == "sqlite", "EXPLAIN QUERY PLAN output is SQLite specific")
+class CampaignIndexUsageTests(TestCase):
+    """Every campaigns-table query behind the hot endpoints must be index-driven."""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = get_user_model().objects.create_user(
+            username="creator", email="creator@example.com", password="pw"
+        )
+        Campaign.objects.bulk_create(
+            [
+                Campaign(
+                    title=f"Campaign {i}",
+                    description="desc",
+                    goal_amount=1000,
+                    current_amount=i,
+                    trending_score=i % 7,
+                    is_active=i % 5 != 0,
+                    creator=user,
+                )
+                for i in range(50)
+            ]
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def assertUsesIndex(self, path, params=None):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(path, params or {})
+        self.assertEqual(response.status_code, 200)
+
+        checked = 0
+        for query in ctx.captured_queries:
+            sql = query["sql"]
+            if not sql.startswith("SELECT") or f'FROM "{CAMPAIGN_TABLE}"' not in sql:
+                continue
+            with connection.cursor() as cursor:
+                cursor.execute("EXPLAIN QUERY PLAN " + sql)
+                plan = [row[-1] for row in cursor.fetchall()]
+            for step in plan:
+                if step.startswith(f"SCAN {CAMPAIGN_TABLE}"):
+                    self.assertIn("INDEX", step, f"{path}: full table scan in\n{sql}\n{plan}")
+            checked += 1
+        self.assertTrue(checked, f"{path} ran no campaign queries")
+
+    def test_spotlight(self):
+        self.assertUsesIndex("/api/campaigns/spotlight")
+
+    def test_search_sorts(self):
+        for sort in ("new", "funded", "trending"):
+            with self.subTest(sort=sort):
+                self.assertUsesIndex("/api/campaigns/search", {"sort": sort})
+
+    @mock.patch("campaigns.api.get_trending_leaderboard", return_value=None)
+    def test_search_cursor_sorts(self, _):
+        # the database path; with a leaderboard snapshot trending pages run no campaign queries
+        for sort in ("new", "funded", "trending"):
+            with self.subTest(sort=sort):
+                first = self.client.get("/api/campaigns/search", {"sort": sort, "cursor": "", "page_size": 5})
+                self.assertUsesIndex(
+                    "/api/campaigns/search",
+                    {"sort": sort, "cursor": first.json()["next_cursor"], "page_size": 5},
+                )
+
+
+class PlatformCountersTests(TestCase):
+    """/stats is a single-row read of counters maintained by signals."""
+
+    def setUp(self):
+        self.creator = get_user_model().objects.create_user(
+            username="creator", email="creator@example.com", password="pw"
+        )
+
+    def stats(self):
+        with self.assertNumQueries(1):
+            return self.client.get("/api/campaigns/stats").json()
+
+    def test_counters_follow_writes(self):
+        campaign = Campaign.objects.create(title="A", description="d", goal_amount=100, creator=self.creator)
+        Campaign.objects.create(title="B", description="d", goal_amount=100, creator=self.creator)
+        Transaction.objects.create(campaign=campaign, amount=25.5, payment_id="p1")
+        Transaction.objects.create(campaign=campaign, amount=10, payment_id="p2")
+        self.assertEqual(self.stats(), {"active_projects": 2, "active_creators": 1, "funds_raised": 35})
+
+        campaign = Campaign.objects.get(pk=campaign.pk)
+        campaign.is_active = False
+        campaign.save()
+        campaign.save()  # no transition, no change
+        get_user_model().objects.create_user(username="other", email="other@example.com", password="pw")
+        self.assertEqual(self.stats(), {"active_projects": 1, "active_creators": 2, "funds_raised": 35})
+
+        campaign.delete()  # inactive, but its transactions go with it
+        self.assertEqual(self.stats()["funds_raised"], 0)
+        self.assertEqual(
+            {f: getattr(rebuild_platform_counters(), f) for f in ("active_projects", "active_creators")},
+            {"active_projects": 1, "active_creators": 2},
+        )
+
+
+class BulkImportExportTests(TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+
+    def path(self, name, content=None):
+        path = os.path.join(self.dir.name, name)
+        if content is not None:
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                f.write(content)
+        return path
+
+    def run_command(self, *args):
+        call_command(*args, stdout=io.StringIO(), stderr=io.StringIO())
+
+    def test_round_trip(self):
+        users = self.path("users.csv", (
+            "username,email,first_name,last_name,role\n"
+            "ann,ann@uni.edu,Ann,Lee,creator\n"
+            "bob,bob@uni.edu,Bob,Ray,explorer\n"
+        ))
+        campaigns = self.path("campaigns.jsonl", "\n".join(json.dumps(row) for row in [
+            {"title": "Rover", "description": "d", "goal_amount": "500", "creator": "ann@uni.edu",
+             "team_members": ["bob@uni.edu"], "tags": "Robotics, STEM", "milestones": [{"title": "m", "done": False}]},
+            {"title": "Garden", "description": "d", "goal_amount": 80, "creator": "bob@uni.edu", "end_date": "2030-01-31"},
+        ]) + "\n")
+        self.run_command("import_users", users, "--chunk-size", "1")
+        self.run_command("import_campaigns", campaigns, "--chunk-size", "1")
+
+        ann = get_user_model().objects.get(email="ann@uni.edu")
+        self.assertFalse(ann.has_usable_password())
+        rover = Campaign.objects.get(title="Rover")
+        self.assertEqual([u.username for u in rover.team_members.all()], ["bob"])
+        self.assertEqual(sorted(rover.tag_index.values_list("slug", flat=True)), ["robotics", "stem"])
+        self.assertTrue(rover.read_model.card)
+        self.assertEqual(self.client.get("/api/campaigns/stats").json()["active_projects"], 2)
+
+        exported = self.path("campaigns.csv")
+        self.run_command("export_campaigns", exported)
+        with open(exported, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertIn("ann@uni.edu,bob@uni.edu", lines[1])
+
+    def test_malformed_rows(self):
+        users = self.path("users.csv", "username,email\nann,ann@uni.edu,extra\n")
+        with self.assertRaisesMessage(CommandError, "line 2: too many columns"):
+            self.run_command("import_users", users)
+
+        get_user_model().objects.create_user(username="ann", email="ann@uni.edu", password="pw")
+        campaigns = self.path("campaigns.csv", "title,description,goal_amount,creator\nA,d,5,ann@uni.edu,x\n")
+        with self.assertRaisesMessage(CommandError, "line 2: too many columns"):
+            self.run_command("import_campaigns", campaigns)
+        for end_date in (20300131, "2030-02-30"):
+            campaigns = self.path("campaigns.jsonl", json.dumps(
+                {"title": "A", "description": "d", "goal_amount": 5, "creator": "ann@uni.edu", "end_date": end_date}
+            ) + "\n")
+            with self.assertRaisesMessage(CommandError, "line 1: end_date must be YYYY-MM-DD"):
+                self.run_command("import_campaigns", campaigns)
+        campaigns = self.path(
+            "campaigns.csv", 'title,description,goal_amount,creator,milestones\nA,d,5,ann@uni.edu,"[{oops"\n'
+        )
+        with self.assertRaisesMessage(CommandError, "line 2: milestones is not valid JSON"):
+            self.run_command("import_campaigns", campaigns)
+
+    def test_export_import_round_trip(self):
+        User = get_user_model()
+        ann = User.objects.create_user(username="ann", email="ann@uni.edu", password="pw", first_name="Ann")
+        bob = User.objects.create_user(username="bob", email="bob@uni.edu", password="pw", is_active=False)
+        rover = Campaign.objects.create(
+            title="Rover, \"Mk II\"", description="multi\nline", goal_amount=Decimal("500.50"), creator=ann,
+            tags="Robotics, STEM", school="MIT", milestones=[{"title": "m", "done": False}],
+            end_date=date(2030, 1, 31), sponsored_by="ACME",
+        )
+        rover.team_members.add(bob)
+        Campaign.objects.create(title="Garden", description="d", goal_amount=80, creator=bob, is_active=False)
+
+        def snapshot():
+            users = User.objects.order_by("email").values_list(*USER_FIELDS)
+            campaigns = Campaign.objects.select_related("creator").order_by("title")
+            return list(users), [campaign_row(c) for c in campaigns]
+
+        before = snapshot()
+        for fmt in ("csv", "jsonl"):
+            with self.subTest(fmt=fmt):
+                users, campaigns = self.path(f"users.{fmt}"), self.path(f"campaigns.{fmt}")
+                self.run_command("export_users", users, "--include-password-hashes")
+                self.run_command("export_campaigns", campaigns)
+                User.objects.all().delete()
+                self.run_command("import_users", users)
+                self.run_command("import_campaigns", campaigns)
+                self.assertEqual(snapshot(), before)
+
+
+class ReadModelTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.creator = get_user_model().objects.create_user(
+            username="ann", email="ann@example.com", password="pw"
+        )
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(self.creator).access_token}"}
+
+    def tearDown(self):
+        local_users.discard(self.creator.pk)
+
+    def test_fractional_amounts(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            campaign = Campaign.objects.create(
+                title="A", description="d", goal_amount=Decimal("100.50"), current_amount=Decimal("9.99"),
+                creator=self.creator,
+            )
+        card = json.loads(get_cards([campaign.pk])[0])
+        self.assertEqual((card["goal_amount"], card["current_amount"]), (100, 9))
+
+    def test_failed_refresh_drops_the_stale_row(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            campaign = Campaign.objects.create(title="A", description="d", goal_amount=100, creator=self.creator)
+        url = f"/api/campaigns/detail/{campaign.pk}/"
+        self.client.get(url, **self.auth)
+
+        with mock.patch("campaigns.readmodel.build_read_model", side_effect=ValueError("bad data")):
+            with self.assertLogs("campaigns.readmodel", "ERROR"), self.captureOnCommitCallbacks(execute=True):
+                campaign.title = "B"
+                campaign.save()
+        self.assertFalse(CampaignReadModel.objects.filter(campaign=campaign).exists())
+        self.assertEqual(self.client.get(url, **self.auth).json()["title"], "B")
+
+    def test_rename_changes_etag(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            campaign = Campaign.objects.create(title="A", description="d", goal_amount=100, creator=self.creator)
+        url = f"/api/campaigns/detail/{campaign.pk}/"
+        etag = self.client.get(url, **self.auth)["ETag"]
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.auth).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.creator.username = "annie"
+            self.creator.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["creator"]["name"], "annie")
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class LeaderboardTests(TestCase):
+    def test_reader_builds_missing_snapshot(self):
+        cache.clear()
+        creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        Campaign.objects.bulk_create(
+            [Campaign(title=f"C{i}", description="d", goal_amount=10, trending_score=i, creator=creator) for i in range(3)]
+        )
+        self.client.get("/api/campaigns/spotlight")
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/campaigns/search", {"sort": "trending"})
+        self.assertEqual([item["title"] for item in response.json()["items"]], ["C2", "C1", "C0"])
+
+    def test_snapshot_expires_with_trending_staleness(self):
+        cache.clear()
+        creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        campaign = Campaign.objects.create(title="Old", description="d", goal_amount=10, creator=creator)
+        with mock.patch("campaigns.leaderboard.TRENDING_MAX_STALENESS", 1):
+            self.assertEqual(self.client.get("/api/campaigns/spotlight").json()["items"][0]["title"], "Old")
+            # an UPDATE that bypasses every invalidation hook
+            Campaign.objects.filter(pk=campaign.pk).update(title="New")
+            self.assertEqual(self.client.get("/api/campaigns/spotlight").json()["items"][0]["title"], "Old")
+            time.sleep(1.1)
+            self.assertEqual(self.client.get("/api/campaigns/spotlight").json()["items"][0]["title"], "New")
+
+
+class EngagementEndpointTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(self.user).access_token}"}
+        self.campaign = Campaign.objects.create(title="A", description="d", goal_amount=10, creator=self.user)
+        patcher = mock.patch("campaigns.api.engagement_buffer")
+        self.buffer = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        local_users.discard(self.user.pk)
+
+    def post(self, event, count=1, campaign_id=None, **extra):
+        return self.client.post(
+            f"/api/campaigns/{campaign_id or self.campaign.pk}/engagement",
+            {"event": event, "count": count}, content_type="application/json", **extra,
+        )
+
+    def test_anonymous_views_only(self):
+        self.assertEqual(self.post("view", 5).status_code, 202)
+        for event in ("like", "comment", "save"):
+            with self.subTest(event=event):
+                self.assertEqual(self.post(event).status_code, 401)
+        self.buffer.record.assert_called_once_with(self.campaign.pk, "view", 5)
+
+    def test_authenticated_events_count_one(self):
+        self.assertEqual(self.post("like", **self.auth).status_code, 202)
+        self.assertEqual(self.post("like", 50, **self.auth).status_code, 400)
+        self.buffer.record.assert_called_once_with(self.campaign.pk, "like", 1)
+
+    def test_unknown_campaign(self):
+        self.assertEqual(self.post("view", campaign_id=self.campaign.pk + 1).status_code, 404)
+        self.buffer.record.assert_not_called()
+
+
+class EngagementBufferTests(TestCase):
+    def setUp(self):
+        creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        self.a, self.b = (
+            Campaign.objects.create(title=t, description="d", goal_amount=10, creator=creator) for t in "AB"
+        )
+        self.buffer = EngagementBuffer()
+        # no timer thread here; EngagementTimerTests covers it
+        self.buffer._flusher_pid = os.getpid()
+
+    def counts(self, column):
+        return list(Campaign.objects.order_by("id").values_list(column, flat=True))
+
+    def test_kept_until_flush(self):
+        # below both thresholds nothing is written; the atexit flush (CampaignsConfig.ready)
+        # writes it on a clean shutdown, a killed process loses it
+        self.buffer.record(self.a.pk, "view", 2)
+        self.buffer.record(self.a.pk, "like")
+        self.assertEqual(self.counts("view_count"), [0, 0])
+        self.assertEqual(self.buffer.flush(), 1)
+        self.assertEqual((self.counts("view_count"), self.counts("like_count")), ([2, 0], [1, 0]))
+        self.assertTrue(Campaign.objects.get(pk=self.a.pk).trending_dirty)
+
+    def test_full_buffer_flushes_on_record(self):
+        # so at most MAX_PENDING increments are ever at risk
+        with mock.patch("campaigns.engagement.MAX_PENDING", 3):
+            self.buffer.record(self.a.pk, "view", 2)
+            self.assertEqual(self.counts("view_count"), [0, 0])
+            self.buffer.record(self.b.pk, "view")
+        self.assertEqual(self.counts("view_count"), [2, 1])
+
+    def test_flush_is_atomic(self):
+        self.buffer.record(self.a.pk, "like")
+        self.buffer.record(self.b.pk, "like")
+        update = QuerySet.update
+        calls = []
+
+        def fail_second(qs, **kwargs):
+            calls.append(qs)
+            if len(calls) == 2:
+                raise DatabaseError("disk full")
+            return update(qs, **kwargs)
+
+        with mock.patch.object(QuerySet, "update", autospec=True, side_effect=fail_second):
+            with self.assertLogs("campaigns.engagement", "ERROR"):
+                self.assertEqual(self.buffer.flush(), 0)
+        # the first campaign's UPDATE was rolled back with the second; the batch is dropped
+        self.assertEqual(self.counts("like_count"), [0, 0])
+        self.assertEqual(self.buffer.flush(), 0)
+
+
+class EngagementTimerTests(TransactionTestCase):
+    def test_flushed_without_further_traffic(self):
+        creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        campaign = Campaign.objects.create(title="A", description="d", goal_amount=10, creator=creator)
+        buffer = EngagementBuffer()
+        with mock.patch("campaigns.engagement.FLUSH_SECONDS", 0.05):
+            buffer.record(campaign.pk, "view", 3)
+            for _ in range(100):
+                time.sleep(0.05)
+                campaign.refresh_from_db(fields=["view_count"])
+                if campaign.view_count:
+                    break
+        self.assertEqual(campaign.view_count, 3)
+
+
+class DetailQueryCountTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        User = get_user_model()
+        self.user = User.objects.create_user(username="ann", email="ann@example.com", password="pw")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(self.user).access_token}"}
+        team = [User.objects.create_user(username=f"u{i}", email=f"u{i}@example.com", password="pw") for i in range(3)]
+        self.ids = []
+        for i in range(100):
+            campaign = Campaign.objects.create(
+                title=f"C{i}", description="d", goal_amount=10, tags="a, b", creator=self.user
+            )
+            campaign.team_members.add(*team[: i % 4])
+            self.ids.append(campaign.pk)
+        add_campaign_tags(Campaign.objects.all())
+        # the auth lookup is cached from here on
+        self.assertEqual(self.client.get(f"/api/campaigns/detail/{self.ids[0]}/", **self.auth).status_code, 200)
+
+    def tearDown(self):
+        local_users.discard(self.user.pk)
+
+    def forget_details(self):
+        # not cache.clear(): that would also drop the cached auth lookup
+        cache.delete_many([detail_cache_key(i) for i in self.ids])
+
+    def queries(self, url, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params, **self.auth)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries)
+
+    def batch(self, ids):
+        return self.queries("/api/campaigns/detail/batch", ids=",".join(map(str, ids)))
+
+    def test_batch_query_count_is_constant(self):
+        for read_models in ("missing", "built"):
+            counts = {}
+            for n in (1, 10, 100):
+                self.forget_details()
+                if read_models == "missing":
+                    CampaignReadModel.objects.all().delete()
+                response, counts[n] = self.batch(self.ids[:n])
+                self.assertEqual(len(response.json()["items"]), n)
+            with self.subTest(read_models=read_models):
+                self.assertEqual(len(set(counts.values())), 1, counts)
+        self.assertEqual(counts[100], 1)  # the read-model rows, in one query
+        with self.assertNumQueries(0):
+            self.batch(self.ids)
+
+    def test_detail_query_count_does_not_depend_on_team(self):
+        counts = set()
+        for campaign_id in self.ids[:4]:  # 0 to 3 team members
+            self.forget_details()
+            CampaignReadModel.objects.filter(campaign_id=campaign_id).delete()
+            counts.add(self.queries(f"/api/campaigns/detail/{campaign_id}/")[1])
+        self.assertEqual(len(counts), 1, counts)
+        with self.assertNumQueries(0):
+            self.queries(f"/api/campaigns/detail/{self.ids[3]}/")
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        for title, description, tags in [
+            ("Robot arm", "Built with javascript", ""),
+            ("Garden", "A robot that waters plants", ""),
+            ("Weather station", "Sensors", "robot"),
+            ("Java course", "Teaching java", ""),
+        ]:
+            Campaign.objects.create(title=title, description=description, tags=tags, goal_amount=10, creator=creator)
+
+    def titles(self, q):
+        response = self.client.get("/api/campaigns/search", {"q": q})
+        self.assertEqual(response.status_code, 200)
+        return [item["title"] for item in response.json()["items"]]
+
+    @skipUnless(connection.vendor in ("sqlite", "postgresql"), "full-text backends only")
+    def test_ranking(self):
+        # title > tags > description
+        self.assertEqual(self.titles("robot"), ["Robot arm", "Weather station", "Garden"])
+
+    @skipUnless(connection.vendor in ("sqlite", "postgresql"), "full-text backends only")
+    def test_whole_tokens(self):
+        self.assertEqual(self.titles("java"), ["Java course"])
+        self.assertEqual(self.titles("JavaScript!"), ["Robot arm"])
+        self.assertEqual(self.titles("rob"), [])
+
+    @skipUnless(connection.vendor == "sqlite", "SQLite FTS5 triggers")
+    def test_lost_triggers_are_restored(self):
+        with connection.cursor() as cursor:
+            cursor.execute("DROP TRIGGER campaigns_campaign_fts_ai")
+        Campaign.objects.create(title="Kite", description="d", goal_amount=10, creator=get_user_model().objects.get())
+        self.assertEqual(self.titles("kite"), [])
+        ensure_fts_triggers()
+        cache.clear()
+        self.assertEqual(self.titles("kite"), ["Kite"])
+
+    def test_punctuation_only_query_browses(self):
+        self.assertEqual(sorted(self.titles("?! --")), sorted(self.titles("")))
+        self.assertEqual(len(self.titles("?! --")), 4)
+
+
+class TrendingRecomputeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        self.campaigns = {
+            title: Campaign.objects.create(title=title, description="d", goal_amount=10, creator=creator)
+            for title in ("liked yesterday", "viewed now", "idle")
+        }
+        now = timezone.now()
+        for title, hours_ago, activity in [
+            ("liked yesterday", 24, {"like_count": 100}),
+            ("viewed now", 0, {"view_count": 10}),
+            ("idle", 48, {}),
+        ]:
+            Campaign.objects.filter(pk=self.campaigns[title].pk).update(
+                last_activity_at=now - timedelta(hours=hours_ago), trending_dirty=False, **activity
+            )
+
+    def hot_order(self):
+        return list(Campaign.objects.order_by("-hot_score", "-id").values_list("title", flat=True))
+
+    def test_hot_score_backfill(self):
+        migration = importlib.import_module("campaigns.migrations.0016_backfill_hot_score")
+        migration.backfill_hot_score(django_apps, SimpleNamespace(connection=connection))
+        # recency outweighs 10x the activity a day earlier
+        self.assertEqual(self.hot_order(), ["viewed now", "liked yesterday", "idle"])
+
+    def test_hot_mode_rescores_dirty_rows(self):
+        Campaign.objects.filter(pk=self.campaigns["idle"].pk).update(
+            last_activity_at=timezone.now(), like_count=100, trending_dirty=True
+        )
+        with mock.patch("campaigns.services.TRENDING_MODE", "hot"):
+            self.assertEqual(recompute_trending_scores(), 1)
+        self.assertEqual(self.hot_order()[0], "idle")
+
+    def test_full_recompute_is_one_update(self):
+        Campaign.objects.filter(pk=self.campaigns["idle"].pk).update(is_active=False)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(recompute_trending_scores(full=True), 2)
+        updates = [q["sql"] for q in queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        scores = dict(Campaign.objects.values_list("title", "trending_score"))
+        self.assertGreater(scores["liked yesterday"], scores["viewed now"])
+        self.assertEqual(scores["idle"], 0.0)
+
+    def test_only_dirty_or_due_rows_are_rescored(self):
+        self.assertEqual(recompute_trending_scores(), 3)  # never scored: all due
+        self.assertFalse(Campaign.objects.filter(trending_dirty=True).exists())
+        self.assertEqual(recompute_trending_scores(), 0)
+
+        liked = self.campaigns["liked yesterday"].pk
+        Campaign.objects.filter(pk=liked).update(like_count=200, trending_dirty=True)
+        self.assertEqual(recompute_trending_scores(), 1)
+        self.assertFalse(Campaign.objects.get(pk=liked).trending_dirty)
+
+    def test_idle_rows_are_rescored_when_their_bucket_rolls_over(self):
+        recompute_trending_scores()
+        idle = self.campaigns["viewed now"].pk
+        before = Campaign.objects.get(pk=idle).trending_score
+        later = timezone.now() + TRENDING_DECAY_BUCKET + timedelta(minutes=1)
+        with mock.patch("campaigns.services.timezone.now", return_value=later):
+            # every row's bucket has passed; each is rescored once and then not until the next one
+            self.assertEqual(recompute_trending_scores(), 3)
+            self.assertEqual(recompute_trending_scores(), 0)
+        campaign = Campaign.objects.get(pk=idle)
+        self.assertLess(campaign.trending_score, before)
+        self.assertGreater(campaign.trending_rescore_at, later)
+
+    def test_decay_mode_keeps_hot_score_current(self):
+        recompute_trending_scores()
+        self.assertEqual(self.hot_order(), ["viewed now", "liked yesterday", "idle"])
+
+
+class DetailCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(self.user).access_token}"}
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign = Campaign.objects.create(title="A", description="d", goal_amount=10, creator=self.user)
+        self.url = f"/api/campaigns/detail/{self.campaign.pk}/"
+
+    def tearDown(self):
+        local_users.discard(self.user.pk)
+
+    def get(self, **headers):
+        return self.client.get(self.url, **headers, **self.auth)
+
+    def test_conditional_get(self):
+        first = self.get()
+        self.assertEqual(first.status_code, 200)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get(HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+            self.assertEqual(self.get(HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code, 304)
+        self.assertEqual(self.get(HTTP_IF_NONE_MATCH='W/"stale"').status_code, 200)
+
+    def test_save_invalidates(self):
+        etag = self.get()["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.title = "B"
+            self.campaign.save()
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["title"], "B")
+
+    def test_team_change_invalidates(self):
+        etag = self.get()["ETag"]
+        bob = get_user_model().objects.create_user(username="bob", email="bob@example.com", password="pw")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.team_members.add(bob)
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["team_members"], [{"id": bob.pk, "name": "bob"}])
+
+
+class SuggestTests(TestCase):
+    def setUp(self):
+        self.creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        self.index = PrefixIndex()
+
+    def create(self, title, score=0.0, **fields):
+        campaign = Campaign.objects.create(
+            title=title, description="d", goal_amount=10, creator=self.creator, trending_score=score, **fields
+        )
+        sync_campaign_tags(campaign)
+        return campaign
+
+    def texts(self, prefix, limit=8):
+        return [(s["kind"], s["text"]) for s in self.index.suggest(prefix, limit)]
+
+    def test_ranked_by_trending_score(self):
+        self.create("Robot arm", 1.0)
+        self.create("Solar robot", 5.0)
+        self.create("Robotics club", 3.0, is_active=False)
+        self.assertEqual(self.texts("rob"), [("campaign", "Solar robot"), ("campaign", "Robot arm")])
+        self.assertEqual(self.texts("rob", limit=1), [("campaign", "Solar robot")])
+
+    def test_upsert_matches_rebuild(self):
+        self.create("Garden", tags="Robotics")
+        self.index.build()
+        # a second campaign spelling the tag differently shares the first one's Tag row
+        late = self.create("Kite", 2.0, tags="ROBOTICS ,  drones")
+        self.index.upsert(late)
+        after_upsert = self.texts("ro")
+        self.index.build()
+        self.assertEqual(after_upsert, self.texts("ro"))
+        self.assertEqual(self.texts("dr"), [("tag", "drones")])
+
+        late.is_active = False
+        self.index.upsert(late)
+        self.assertEqual(self.texts("dr"), [])
+
+    def test_one_background_rebuild_at_a_time(self):
+        self.index.build()
+        self.index._built_at -= 10_000
+        with mock.patch("campaigns.suggest.threading.Thread") as thread:
+            for _ in range(3):
+                self.index.suggest("ga")
+        thread.assert_called_once()
+
+
+class SearchPaginationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        Campaign.objects.bulk_create(
+            [Campaign(title=f"C{i}", description="d", goal_amount=i + 1, creator=creator) for i in range(5)]
+        )
+
+    def test_page_bounds(self):
+        for params in ({"page": 0}, {"page": -1}, {"page_size": 0}, {"page_size": -5}, {"page_size": 101}):
+            with self.subTest(**params):
+                self.assertEqual(self.client.get("/api/campaigns/search", params).status_code, 422)
+        self.assertEqual(self.client.get("/api/campaigns/search", {"page_size": 100}).status_code, 200)
+
+    def test_cursor_round_trip(self):
+        now = timezone.now()
+        for sort, value in (("new", now), ("funded", Decimal("12.50")), ("trending", 3.25)):
+            with self.subTest(sort=sort):
+                self.assertEqual(decode_cursor(encode_cursor(sort, value, 42), sort), (value, 42))
+        with self.assertRaises(HttpError):
+            decode_cursor(encode_cursor("new", now, 42), "funded")
+        with self.assertRaises(HttpError):
+            decode_cursor("not a cursor", "new")
+
+    def test_cursor_pages_cover_everything_once(self):
+        seen, cursor = [], ""
+        while cursor is not None:
+            data = self.client.get("/api/campaigns/search", {"sort": "funded", "page_size": 2, "cursor": cursor}).json()
+            seen += [item["title"] for item in data["items"]]
+            cursor = data["next_cursor"]
+        self.assertEqual(seen, ["C4", "C3", "C2", "C1", "C0"])
+
+
+class CountResultsTests(TestCase):
+    filters = {"q": "", "tags": [], "school": "uni", "min_goal": None, "max_goal": None}
+    browse = {"q": "", "tags": [], "school": "", "min_goal": None, "max_goal": None}
+
+    def setUp(self):
+        cache.clear()
+        creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        Campaign.objects.bulk_create(
+            [Campaign(title=f"C{i}", description="d", goal_amount=10, creator=creator) for i in range(5)]
+        )
+        self.qs = Campaign.objects.all()
+
+    def test_small_result_sets_are_exact(self):
+        with mock.patch("campaigns.counting.estimate_table_rows", return_value=None):
+            self.assertEqual(count_results(self.qs, self.browse), (5, True))
+        self.assertEqual(count_results(self.qs, self.filters), (5, True))
+
+    def test_large_unfiltered_browse_uses_estimate(self):
+        with mock.patch("campaigns.counting.estimate_table_rows", return_value=50_000), self.assertNumQueries(0):
+            self.assertEqual(count_results(self.qs, self.browse), (50_000, False))
+        # a filtered search never uses the table estimate
+        with mock.patch("campaigns.counting.estimate_table_rows", return_value=50_000):
+            self.assertEqual(count_results(self.qs, self.filters), (5, True))
+
+    def test_large_counts_are_cached_and_then_inexact(self):
+        with mock.patch("campaigns.counting.EXACT_COUNT_LIMIT", 2):
+            with self.assertNumQueries(2):  # the probe, then COUNT(*)
+                self.assertEqual(count_results(self.qs, self.filters), (5, True))
+            with self.assertNumQueries(1):  # the probe only
+                self.assertEqual(count_results(self.qs, self.filters), (5, False))
+
+
+class FacetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        for goal, school, tags in [
+            (500, "MIT", "robotics, ai"),
+            (2000, "MIT", "robotics"),
+            (7000, "CMU", "ai"),
+            (20000, "", "art"),
+        ]:
+            sync_campaign_tags(
+                Campaign.objects.create(
+                    title="C", description="d", goal_amount=goal, school=school, tags=tags, creator=creator
+                )
+            )
+
+    def test_counts(self):
+        facets = compute_facets(Campaign.objects.filter(goal_amount__lt=10000), ["goal", "school", "tags"])
+        self.assertEqual(facets["tags"], [{"value": "ai", "count": 2}, {"value": "robotics", "count": 2}])
+        self.assertEqual(facets["school"], [{"value": "MIT", "count": 2}, {"value": "CMU", "count": 1}])
+        self.assertEqual([b["count"] for b in facets["goal"]], [1, 1, 1, 0])
+
+    def test_one_query(self):
+        with self.assertNumQueries(1):
+            compute_facets(Campaign.objects.all(), ["goal", "school", "tags"])
+        with self.assertNumQueries(1):
+            self.assertEqual(compute_facets(Campaign.objects.all(), ["school"])["school"][0]["value"], "MIT")
+
+    def test_search_response(self):
+        response = self.client.get("/api/campaigns/search", {"tags": "robotics", "facets": "school,goal"})
+        self.assertEqual(response.json()["facets"]["school"], [{"value": "MIT", "count": 2}])
+
+
+class SearchCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign = Campaign.objects.create(
+                title="Rover", description="d", goal_amount=10, tags="space", creator=creator
+            )
+
+    def search(self, **params):
+        return self.client.get("/api/campaigns/search", {"sort": "new", **params}).json()
+
+    def test_cached_until_a_campaign_is_saved(self):
+        self.search()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.search()["items"][0]["title"], "Rover")
+        version = get_search_version()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.title = "Lander"
+            self.campaign.save()
+        self.assertNotEqual(get_search_version(), version)
+        self.assertEqual(self.search()["items"][0]["title"], "Lander")
+
+    def test_tag_change_invalidates_tag_filtered_pages(self):
+        self.assertEqual(self.search(tags="space")["total"], 1)
+        self.assertEqual(self.search(tags="robots")["total"], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.campaign.tags = "robots"
+            self.campaign.save()
+        self.assertEqual(self.search(tags="space")["total"], 0)
+        self.assertEqual(self.search(tags="robots")["total"], 1)
+
+
+class DonationWindowTests(TestCase):
+    def setUp(self):
+        creator = get_user_model().objects.create_user(username="ann", email="ann@example.com", password="pw")
+        self.campaign = Campaign.objects.create(title="A", description="d", goal_amount=100, creator=creator)
+
+    def counters(self):
+        self.campaign.refresh_from_db(fields=["backer_count_24h", "donation_sum_24h"])
+        return self.campaign.backer_count_24h, self.campaign.donation_sum_24h
+
+    def test_donations_leave_the_window(self):
+        now = timezone.now()
+        record_donation(self.campaign.pk, "10.00", at=now - timedelta(hours=23))
+        record_donation(self.campaign.pk, "5.50", at=now)
+        self.assertEqual(self.counters(), (2, Decimal("15.50")))
+
+        self.assertEqual(expire_donation_windows(now), 0)
+        self.assertEqual(expire_donation_windows(now + timedelta(hours=1)), 1)
+        self.assertEqual(self.counters(), (1, Decimal("5.50")))
+        # each bucket is subtracted once, however often the expiry runs
+        self.assertEqual(expire_donation_windows(now + timedelta(hours=1)), 0)
+        self.assertEqual(expire_donation_windows(now + timedelta(hours=24)), 1)
+        self.assertEqual(self.counters(), (0, Decimal("0")))
+
+    def test_reused_slot_rolls_off_the_old_bucket(self):
+        now = timezone.now()
+        record_donation(self.campaign.pk, "10.00", at=now - timedelta(hours=23))
+        # 24h after the first donation lands in the same slot; no expiry run in between
+        with mock.patch("campaigns.windows.timezone.now", return_value=now + timedelta(hours=1)):
+            record_donation(self.campaign.pk, "3.00")
+        self.assertEqual(self.counters(), (1, Decimal("3.00")))
@@ -0,0 +1,89 @@
+# campaigns/windows.py
+"""
+Bucketed sliding-window counters behind Campaign.backer_count_24h and
+Campaign.donation_sum_24h.
+
+Each campaign has a ring of WINDOW_HOURS hourly DonationWindowSlot rows (slot =
+hour % WINDOW_HOURS). A donation adds to the slot for the current hour; if that
+slot still holds a bucket from a previous lap it is rolled off first. Buckets of
+campaigns that stop receiving donations are rolled off by
+expire_donation_windows(). Either way each bucket is subtracted from the
+campaign exactly once, so the counters never need a rescan of transactions.
+"""
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Campaign, DonationWindowSlot
+
+WINDOW_HOURS = 24
+
+
+def epoch_hour(dt) -> int:
+    return int(dt.timestamp() // 3600)
+
+
+def record_donation(campaign_id: int, amount, at=None):
+    """Count one backer and `amount` towards the campaign's last-24h window."""
+    now_hour = epoch_hour(timezone.now())
+    hour = epoch_hour(at) if at else now_hour
+    if hour <= now_hour - WINDOW_HOURS:
+        return  # already outside the window
+    amount = Decimal(amount)
+
+    with transaction.atomic():
+        slot, _ = DonationWindowSlot.objects.select_for_update().get_or_create(
+            campaign_id=campaign_id,
+            slot=hour % WINDOW_HOURS,
+            defaults={"hour": hour},
+        )
+        if slot.hour > hour:
+            return  # the slot has moved on to a newer lap; this donation is too old
+        expired_backers, expired_amount = 0, Decimal(0)
+        if slot.hour != hour:
+            # the slot still holds the bucket from a previous lap: roll it off
+            expired_backers, expired_amount = slot.backers, slot.amount
+            slot.hour, slot.backers, slot.amount = hour, 0, Decimal(0)
+        slot.backers += 1
+        slot.amount += amount
+        slot.save()
+
+        Campaign.objects.filter(pk=campaign_id).update(
+            backer_count_24h=F("backer_count_24h") + 1 - expired_backers,
+            donation_sum_24h=F("donation_sum_24h") + amount - expired_amount,
+            trending_dirty=True,
+        )
+
+
+def expire_donation_windows(now=None) -> int:
+    """
+    Roll off every non-empty bucket that has left the window; returns how many.
+    Work is proportional to the expired buckets, not the number of campaigns.
+    """
+    cutoff = epoch_hour(now or timezone.now()) - WINDOW_HOURS
+    with transaction.atomic():
+        expired = list(
+            DonationWindowSlot.objects.select_for_update()
+            .filter(hour__lte=cutoff, backers__gt=0)
+            .values_list("id", "campaign_id", "backers", "amount")
+        )
+        if not expired:
+            return 0
+
+        totals = defaultdict(lambda: [0, Decimal(0)])
+        for _, campaign_id, backers, amount in expired:
+            totals[campaign_id][0] += backers
+            totals[campaign_id][1] += amount
+        for campaign_id, (backers, amount) in totals.items():
+            Campaign.objects.filter(pk=campaign_id).update(
+                backer_count_24h=F("backer_count_24h") - backers,
+                donation_sum_24h=F("donation_sum_24h") - amount,
+                trending_dirty=True,
+            )
+        DonationWindowSlot.objects.filter(pk__in=[row[0] for row in expired]).update(
+            backers=0, amount=0
+        )
+    return len(expired)
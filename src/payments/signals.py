@@ -0,0 +1,17 @@
+# payments/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from campaigns.counters import adjust_platform_counters
+from .models import Transaction
+
+
+@receiver(post_save, sender=Transaction)
+def transaction_saved(sender, instance, created, **kwargs):
+    if created:
+        adjust_platform_counters(funds_raised=instance.amount)
+
+
+@receiver(post_delete, sender=Transaction)
+def transaction_deleted(sender, instance, **kwargs):
+    adjust_platform_counters(funds_raised=-instance.amount)
@@ -3,7 +3,9 @@ from decimal import Decimal
 from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.conf import settings
+from django.db import transaction
 from campaigns.models import Campaign
+from campaigns.windows import record_donation
 from payments.models import Transaction
 from payments.services import broadcast_campaign_update
 import paypalrestsdk
@@ -39,13 +41,18 @@ def paypal_webhook(request):
             try:
                 campaign = Campaign.objects.get(id=int(campaign_id))
                 if not Transaction.objects.filter(payment_id=payment_id).exists():
-                    Transaction.objects.create(
-                        campaign=campaign,
-                        amount=amount,
-                        payment_id=payment_id
-                    )
-                    campaign.current_amount += amount
-                    campaign.save()
+                    # the transaction, campaign total, 24h window and platform counters commit together
+                    with transaction.atomic():
+                        Transaction.objects.create(
+                            campaign=campaign,
+                            amount=amount,
+                            payment_id=payment_id
+                        )
+                        campaign.current_amount += amount
+                        # writes only current_amount and the timestamps (Core/dirtyfields.py),
+                        # so the 24h counters below aren't overwritten
+                        campaign.save()
+                        record_donation(campaign.id, amount)
 
                     broadcast_campaign_update(campaign.id, {
                         "current_amount": float(campaign.current_amount),